@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import logging
 import asyncio
-import re
 from asyncio import timeout as async_timeout
 from datetime import timedelta
 
@@ -31,6 +30,7 @@ from homeassistant.exceptions import ServiceValidationError
 
 from .api_client import MetarApiClient
 from .storage import MetarHistoryStorage
+from .utils import validate_icao_format
 from .const import (
     DOMAIN,
     CONF_STATIONS,
@@ -44,7 +44,6 @@ from .const import (
     DEFAULT_ALTITUDE_UNIT,
     DEFAULT_SCAN_INTERVAL,
     RETRY_INTERVALS,
-    ICAO_REGEX,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -76,7 +75,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         station = call.data["station"].upper()
 
         # Validate ICAO format
-        if not re.match(ICAO_REGEX, station):
+        if not validate_icao_format(station):
             raise ServiceValidationError(
                 f"Invalid ICAO code format: {station}",
                 translation_domain=DOMAIN,
@@ -108,7 +107,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         station = call.data["station"].upper()
 
         # Validate ICAO format
-        if not re.match(ICAO_REGEX, station):
+        if not validate_icao_format(station):
             raise ServiceValidationError(
                 f"Invalid ICAO code format: {station}",
                 translation_domain=DOMAIN,
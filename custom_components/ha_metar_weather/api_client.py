@@ -27,7 +27,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.exceptions import HomeAssistantError
 
 from .awc_client import AWCApiClient, AWCApiError
-from .metar_parser import MetarParser
+from .metar_parser import parse_metar
 from .utils import calculate_humidity
 from .const import (
     VALUE_RANGES,
@@ -85,7 +85,7 @@ def merge_awc_numerics(
     station name and the observation time come from AWC. Inputs are not mutated.
 
     Args:
-        parsed: Output of ``MetarParser(raw).get_parsed_data()``.
+        parsed: Output of ``parse_metar(raw)``; not mutated.
         awc_meta: AWC numerics/metadata from ``parse_awc_response``.
 
     Returns:
@@ -200,6 +200,9 @@ class MetarApiClient:
                 try:
                     metar = avwx.Metar(self.icao)
                     return metar
+                except BadStation as err:
+                    _LOGGER.error("Invalid station code %s: %s", self.icao, err)
+                    raise InvalidStationError(f"Invalid station: {err}") from err
                 except Exception as err:
                     _LOGGER.error("Error creating AVWX instance for %s: %s", self.icao, err)
                     raise MetarApiClientError(f"Failed to create AVWX instance: {err}")
@@ -278,7 +281,7 @@ class MetarApiClient:
             return None
 
         # Single parser for all textual fields, AWC numerics overlaid on top.
-        parsed = MetarParser(raw_metar).get_parsed_data()
+        parsed = parse_metar(raw_metar)
         merged = merge_awc_numerics(parsed, awc_meta)
         return self._validate_and_round(merged)
 
@@ -307,9 +310,9 @@ class MetarApiClient:
             if not self._avwx_metar.raw:
                 raise MetarApiClientError("No raw METAR string from AVWX")
 
-            # Parse using our MetarParser (raw string -> canonical dict).
-            parser = MetarParser(self._avwx_metar.raw)
-            parsed_data = parser.get_parsed_data()
+            # Parse using our MetarParser (raw string -> canonical dict). The
+            # parse result is cached and shared; copy before layering fields in.
+            parsed_data = dict(parse_metar(self._avwx_metar.raw))
 
             # Layer in the real station name from AVWX (the parser only yields
             # the ICAO code). Fall back silently to the ICAO if unavailable.
@@ -365,8 +368,11 @@ class MetarApiClient:
             # Create a deep copy to avoid mutating input (including nested objects)
             result = deepcopy(data)
             for key, value in result.items():
-                if key in VALUE_RANGES and value is not None:
-                    min_val, max_val = VALUE_RANGES[key]
+                if value is None:
+                    continue
+                value_range = VALUE_RANGES.get(key)
+                if value_range is not None:
+                    min_val, max_val = value_range
                     try:
                         float_val = float(value)
                         if not min_val <= float_val <= max_val:
@@ -375,8 +381,8 @@ class MetarApiClient:
                                 value, key, min_val, max_val
                             )
                             result[key] = None
-                        elif key in NUMERIC_PRECISION:
-                            result[key] = round(float_val, NUMERIC_PRECISION[key])
+                        elif (precision := NUMERIC_PRECISION.get(key)) is not None:
+                            result[key] = round(float_val, precision)
                     except (ValueError, TypeError):
                         pass
             return result
@@ -386,20 +392,30 @@ class MetarApiClient:
 
 
 
-async def validate_station(hass: HomeAssistant, icao: str) -> bool:
-    """Validate station exists using available sources.
+async def validate_station_avwx(hass: HomeAssistant, icao: str) -> bool:
+    """Validate station exists using AVWX (NOAA FTP) only.
 
-    Uses MetarApiClient which internally handles all exceptions and returns
-    None on failure. No exceptions are expected to propagate from fetch_data()
-    except asyncio.CancelledError which should not be caught.
+    For callers that already asked AWC and got nothing, so the AWC request
+    in fetch_data() is not repeated.
 
     Args:
         hass: Home Assistant instance
         icao: ICAO airport code
 
     Returns:
-        True if station is valid and returns data, False otherwise
+        True if AVWX returns data for the station
+
+    Raises:
+        InvalidStationError: AVWX rejected the station code
+        MetarApiClientError: AVWX returned no data or failed
     """
     client = MetarApiClient(hass, icao)
-    result = await client.fetch_data()
-    return result is not None
+    try:
+        return await client._fetch_from_avwx() is not None
+    except MetarApiClientError:
+        raise
+    except Exception as err:
+        # avwx raises the builtin ConnectionError on network failures and
+        # InvalidRequest on a malformed response; _fetch_from_avwx() only
+        # maps its own error types. Anything else is a source failure.
+        raise MetarApiClientError(f"AVWX error: {err}") from err
@@ -352,12 +352,13 @@ async def validate_station_awc(hass: HomeAssistant, icao: str) -> bool:
         icao: ICAO airport code
 
     Returns:
-        True if station is valid and has data
+        True if station is valid and has a raw METAR (rawOb)
     """
     client = AWCApiClient(hass)
     try:
         result = await client.fetch_single_metar(icao)
-        return result is not None
+        # A row without rawOb cannot be parsed; treat it like no report.
+        return bool(result and result.get("rawOb"))
     except AWCApiError:
         return False
 
@@ -8,8 +8,9 @@ Config flow for METAR Weather integration.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
+import time
 from typing import Any, Dict, Optional
 
 import voluptuous as vol
@@ -19,7 +20,7 @@ from homeassistant.config_entries import (
     ConfigFlow,
     OptionsFlow,
 )
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.selector import (
@@ -29,13 +30,14 @@ from homeassistant.helpers.selector import (
     SelectOptionDict,
 )
 
-from .api_client import MetarApiClientError, InvalidStationError, validate_station
+from .api_client import MetarApiClientError, InvalidStationError, validate_station_avwx
+from .awc_client import validate_station_awc
+from .utils import validate_icao_format
 from .const import (
     DOMAIN,
     CONF_ICAO,
     CONF_TERMS_ACCEPTED,
     CONF_STATIONS,
-    ICAO_REGEX,
     CONF_TEMP_UNIT,
     CONF_WIND_SPEED_UNIT,
     CONF_VISIBILITY_UNIT,
@@ -54,10 +56,25 @@ from .const import (
     UNIT_AUTO,
     UNIT_NATIVE,
     UNIT_FORMATS,
+    VALIDATION_CACHE_TTL,
+    DATA_STATION_PROBES,
+    DATA_STATION_INFLIGHT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static form schemas, built once instead of on every form render.
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_ICAO): str,
+    vol.Required(CONF_TERMS_ACCEPTED, default=False): bool,
+})
+_STATION_ADD_SCHEMA = vol.Schema({
+    vol.Required(CONF_ICAO): str,
+})
+_STATION_CFG_SCHEMA = vol.Schema({
+    vol.Optional("add_another", default=False): bool,
+})
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -67,8 +84,84 @@ class InvalidStation(HomeAssistantError):
     """Error to indicate invalid station code."""
 
 
+async def _async_validate_station(hass: HomeAssistant, icao: str) -> bool:
+    """Validate METAR station connection.
+
+    A station AWC returns a raw METAR for is accepted right away: the raw
+    JSON is enough, no parsing or merging needed. Only when AWC has nothing
+    (204, no rawOb, or the API is down) is AVWX asked, directly rather than
+    through the multi-source client, which would query AWC again.
+
+    Raises:
+        CannotConnect: No source returned data for the station
+        InvalidStation: The station code was rejected as invalid
+    """
+    if await validate_station_awc(hass, icao):
+        return True
+
+    try:
+        is_valid = await validate_station_avwx(hass, icao)
+        if not is_valid:
+            raise CannotConnect
+        return True
+    except InvalidStationError as err:
+        # Specialized exception from api_client - station code is invalid
+        raise InvalidStation from err
+    except MetarApiClientError as err:
+        # General API error - connection issue
+        raise CannotConnect from err
+
+
+async def _cached_validate_station(hass: HomeAssistant, icao: str) -> bool:
+    """Validate a station, reusing a recent successful probe.
+
+    Successes are remembered for VALIDATION_CACHE_TTL seconds and shared by
+    the config and options flows, so re-submitting a form (e.g. after an
+    error on another field) does not hit the network again. Failures are
+    not cached: a transient outage must not block an immediate retry.
+    Expired entries are swept on every call, so the cache holds only the
+    stations validated within the last VALIDATION_CACHE_TTL seconds.
+
+    Kept outside hass.data[DOMAIN], which holds only storage and per-entry
+    coordinators.
+    """
+    probes = hass.data.setdefault(DATA_STATION_PROBES, {})
+    now = time.monotonic()
+    for station in [s for s, at in probes.items() if now - at >= VALIDATION_CACHE_TTL]:
+        del probes[station]
+    if icao in probes:
+        return True
+
+    # Piggyback on a probe for the same station that is already running
+    # (e.g. config flow and options flow submitted together).
+    inflight = hass.data.setdefault(DATA_STATION_INFLIGHT, {})
+    if (pending := inflight.get(icao)) is not None:
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[bool] = hass.loop.create_future()
+    inflight[icao] = future
+    try:
+        await _async_validate_station(hass, icao)
+        probes[icao] = time.monotonic()
+        future.set_result(True)
+        return True
+    except Exception as err:
+        future.set_exception(err)
+        # Mark as retrieved so a probe nobody piggybacked on doesn't log
+        # "Future exception was never retrieved".
+        future.exception()
+        raise
+    finally:
+        del inflight[icao]
+        if not future.done():
+            # The owning flow was cancelled. Its cancellation is not the
+            # waiters' to handle: hand them a retryable error instead.
+            future.set_exception(CannotConnect())
+            future.exception()
+
+
 def _build_unit_options(
-    units: list[str],
+    units: tuple[str, ...],
     include_auto: bool = True,
     include_native: bool = True
 ) -> list[SelectOptionDict]:
@@ -78,12 +171,21 @@ def _build_unit_options(
         options.append(SelectOptionDict(value=UNIT_AUTO, label="Auto (Home Assistant)"))
     if include_native:
         options.append(SelectOptionDict(value=UNIT_NATIVE, label="Native (METAR)"))
-    for unit in units:
-        display = UNIT_FORMATS.get(unit, unit)
-        options.append(SelectOptionDict(value=unit, label=display))
+    options.extend(
+        SelectOptionDict(value=unit, label=UNIT_FORMATS.get(unit, unit))
+        for unit in units
+    )
     return options
 
 
+# Unit choices never change at runtime; build the dropdown options once.
+_TEMP_OPTIONS = _build_unit_options(AVAILABLE_TEMP_UNITS)
+_WIND_OPTIONS = _build_unit_options(AVAILABLE_WIND_SPEED_UNITS)
+_VIS_OPTIONS = _build_unit_options(AVAILABLE_VISIBILITY_UNITS)
+_PRESS_OPTIONS = _build_unit_options(AVAILABLE_PRESSURE_UNITS)
+_ALT_OPTIONS = _build_unit_options(AVAILABLE_ALTITUDE_UNITS)
+
+
 def _build_unit_selector(options: list[SelectOptionDict]) -> SelectSelector:
     """Build a dropdown selector for unit options."""
     return SelectSelector(
@@ -94,6 +196,32 @@ def _build_unit_selector(options: list[SelectOptionDict]) -> SelectSelector:
     )
 
 
+# Unit preferences form. Defaults match a fresh entry; the options flow
+# overlays the entry's current values as suggestions.
+_UNITS_SCHEMA = vol.Schema({
+    vol.Required(
+        CONF_TEMP_UNIT,
+        default=UNIT_AUTO
+    ): _build_unit_selector(_TEMP_OPTIONS),
+    vol.Required(
+        CONF_WIND_SPEED_UNIT,
+        default=DEFAULT_WIND_SPEED_UNIT
+    ): _build_unit_selector(_WIND_OPTIONS),
+    vol.Required(
+        CONF_VISIBILITY_UNIT,
+        default=UNIT_AUTO
+    ): _build_unit_selector(_VIS_OPTIONS),
+    vol.Required(
+        CONF_PRESSURE_UNIT,
+        default=UNIT_AUTO
+    ): _build_unit_selector(_PRESS_OPTIONS),
+    vol.Required(
+        CONF_ALTITUDE_UNIT,
+        default=DEFAULT_ALTITUDE_UNIT
+    ): _build_unit_selector(_ALT_OPTIONS),
+})
+
+
 class HaMetarWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for METAR Weather."""
 
@@ -120,21 +248,8 @@ class HaMetarWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
         return HaMetarWeatherOptionsFlow(config_entry)
 
     async def _validate_station(self, icao: str) -> bool:
-        """Validate METAR station connection.
-
-        Uses multi-source validation (AWC API + AVWX fallback).
-        """
-        try:
-            is_valid = await validate_station(self.hass, icao)
-            if not is_valid:
-                raise CannotConnect
-            return True
-        except InvalidStationError as err:
-            # Specialized exception from api_client - station code is invalid
-            raise InvalidStation from err
-        except MetarApiClientError as err:
-            # General API error - connection issue
-            raise CannotConnect from err
+        """Validate METAR station connection."""
+        return await _cached_validate_station(self.hass, icao)
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -151,23 +266,23 @@ class HaMetarWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
+            icao = user_input[CONF_ICAO].upper()
+            user_input[CONF_ICAO] = icao
             if not user_input.get(CONF_TERMS_ACCEPTED, False):
                 errors["base"] = "terms_not_accepted"
-            elif not re.match(ICAO_REGEX, user_input[CONF_ICAO].upper()):
+            elif not validate_icao_format(icao):
                 errors[CONF_ICAO] = "invalid_icao"
             else:
-                user_input[CONF_ICAO] = user_input[CONF_ICAO].upper()
-
                 # Check if already configured BEFORE making API call
-                await self.async_set_unique_id(user_input[CONF_ICAO])
+                await self.async_set_unique_id(icao)
                 self._abort_if_unique_id_configured()
 
                 try:
-                    await self._validate_station(user_input[CONF_ICAO])
+                    await self._validate_station(icao)
 
                     # Store user input and proceed to units configuration
                     self._user_input = user_input
-                    self._user_input[CONF_STATIONS] = [user_input[CONF_ICAO]]
+                    self._user_input[CONF_STATIONS] = [icao]
                     return await self.async_step_units()
 
                 except CannotConnect:
@@ -180,10 +295,7 @@ class HaMetarWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_ICAO): str,
-                vol.Required(CONF_TERMS_ACCEPTED, default=False): bool,
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -209,37 +321,9 @@ class HaMetarWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
                 data=self._user_input,
             )
 
-        # Build unit selection schema with dropdown selectors
-        temp_options = _build_unit_options(AVAILABLE_TEMP_UNITS)
-        wind_options = _build_unit_options(AVAILABLE_WIND_SPEED_UNITS)
-        visibility_options = _build_unit_options(AVAILABLE_VISIBILITY_UNITS)
-        pressure_options = _build_unit_options(AVAILABLE_PRESSURE_UNITS)
-        altitude_options = _build_unit_options(AVAILABLE_ALTITUDE_UNITS)
-
         return self.async_show_form(
             step_id="units",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_TEMP_UNIT,
-                    default=UNIT_AUTO
-                ): _build_unit_selector(temp_options),
-                vol.Required(
-                    CONF_WIND_SPEED_UNIT,
-                    default=DEFAULT_WIND_SPEED_UNIT
-                ): _build_unit_selector(wind_options),
-                vol.Required(
-                    CONF_VISIBILITY_UNIT,
-                    default=UNIT_AUTO
-                ): _build_unit_selector(visibility_options),
-                vol.Required(
-                    CONF_PRESSURE_UNIT,
-                    default=UNIT_AUTO
-                ): _build_unit_selector(pressure_options),
-                vol.Required(
-                    CONF_ALTITUDE_UNIT,
-                    default=DEFAULT_ALTITUDE_UNIT
-                ): _build_unit_selector(altitude_options),
-            }),
+            data_schema=_UNITS_SCHEMA,
         )
 
 
@@ -254,8 +338,20 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
             entry: Current config entry
         """
         self._entry = entry
-        self._stations = list(entry.data.get(CONF_STATIONS, []))
-        self._new_stations = list(self._stations)
+        stations = entry.data.get(CONF_STATIONS) or ()
+        # Read-only snapshot of the configured stations; edits go to _new_stations
+        self._stations: tuple[str, ...] = tuple(stations)
+        self._new_stations: list[str] = list(stations)
+        # Mirror of _new_stations for O(1) duplicate checks
+        self._new_stations_set: set[str] = set(self._new_stations)
+        # The configured stations don't change during the flow
+        self._stations_str = (
+            "\n".join(f"• {station}" for station in self._stations) or "No stations"
+        )
+
+    async def _validate_station(self, icao: str) -> bool:
+        """Validate METAR station connection."""
+        return await _cached_validate_station(self.hass, icao)
 
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -303,43 +399,23 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
             return self.async_create_entry(title="", data={})
 
         # Get current unit settings
-        current_temp = self._entry.data.get(CONF_TEMP_UNIT, UNIT_AUTO)
-        current_wind = self._entry.data.get(CONF_WIND_SPEED_UNIT, DEFAULT_WIND_SPEED_UNIT)
-        current_vis = self._entry.data.get(CONF_VISIBILITY_UNIT, UNIT_AUTO)
-        current_press = self._entry.data.get(CONF_PRESSURE_UNIT, UNIT_AUTO)
-        current_alt = self._entry.data.get(CONF_ALTITUDE_UNIT, DEFAULT_ALTITUDE_UNIT)
-
-        # Build unit selection schema with dropdown selectors
-        temp_options = _build_unit_options(AVAILABLE_TEMP_UNITS)
-        wind_options = _build_unit_options(AVAILABLE_WIND_SPEED_UNITS)
-        visibility_options = _build_unit_options(AVAILABLE_VISIBILITY_UNITS)
-        pressure_options = _build_unit_options(AVAILABLE_PRESSURE_UNITS)
-        altitude_options = _build_unit_options(AVAILABLE_ALTITUDE_UNITS)
+        current_units = {
+            CONF_TEMP_UNIT: self._entry.data.get(CONF_TEMP_UNIT, UNIT_AUTO),
+            CONF_WIND_SPEED_UNIT: self._entry.data.get(
+                CONF_WIND_SPEED_UNIT, DEFAULT_WIND_SPEED_UNIT
+            ),
+            CONF_VISIBILITY_UNIT: self._entry.data.get(CONF_VISIBILITY_UNIT, UNIT_AUTO),
+            CONF_PRESSURE_UNIT: self._entry.data.get(CONF_PRESSURE_UNIT, UNIT_AUTO),
+            CONF_ALTITUDE_UNIT: self._entry.data.get(
+                CONF_ALTITUDE_UNIT, DEFAULT_ALTITUDE_UNIT
+            ),
+        }
 
         return self.async_show_form(
             step_id="units",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_TEMP_UNIT,
-                    default=current_temp
-                ): _build_unit_selector(temp_options),
-                vol.Required(
-                    CONF_WIND_SPEED_UNIT,
-                    default=current_wind
-                ): _build_unit_selector(wind_options),
-                vol.Required(
-                    CONF_VISIBILITY_UNIT,
-                    default=current_vis
-                ): _build_unit_selector(visibility_options),
-                vol.Required(
-                    CONF_PRESSURE_UNIT,
-                    default=current_press
-                ): _build_unit_selector(pressure_options),
-                vol.Required(
-                    CONF_ALTITUDE_UNIT,
-                    default=current_alt
-                ): _build_unit_selector(altitude_options),
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _UNITS_SCHEMA, current_units
+            ),
         )
 
     async def async_step_stations(
@@ -357,12 +433,10 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
         if user_input is not None:
             return await self.async_step_station_add()
 
-        stations_str = "\n".join(f"• {station}" for station in self._stations) or "No stations"
-
         return self.async_show_form(
             step_id="stations",
             description_placeholders={
-                "stations": stations_str
+                "stations": self._stations_str
             },
         )
 
@@ -382,9 +456,9 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
 
         if user_input is not None:
             station = user_input[CONF_ICAO].upper()
-            if not re.match(ICAO_REGEX, station):
+            if not validate_icao_format(station):
                 errors[CONF_ICAO] = "invalid_icao"
-            elif station in self._new_stations:
+            elif station in self._new_stations_set:
                 errors[CONF_ICAO] = "station_exists"
             else:
                 # Check if station exists in any OTHER config entry (prevent duplicates)
@@ -396,11 +470,10 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
 
             if not errors:
                 try:
-                    is_valid = await validate_station(self.hass, station)
-                    if not is_valid:
-                        raise CannotConnect
+                    await self._validate_station(station)
 
                     self._new_stations.append(station)
+                    self._new_stations_set.add(station)
                     return await self.async_step_station_configure()
 
                 except CannotConnect:
@@ -413,9 +486,7 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="station_add",
-            data_schema=vol.Schema({
-                vol.Required(CONF_ICAO): str,
-            }),
+            data_schema=_STATION_ADD_SCHEMA,
             errors=errors,
         )
 
@@ -446,9 +517,7 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="station_configure",
-            data_schema=vol.Schema({
-                vol.Optional("add_another", default=False): bool,
-            }),
+            data_schema=_STATION_CFG_SCHEMA,
         )
 
     async def async_step_station_remove(
@@ -465,17 +534,19 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
         """
         # Refresh from current entry data to avoid stale data issues
         self._new_stations = list(self._entry.data.get(CONF_STATIONS, []))
+        self._new_stations_set = set(self._new_stations)
 
         errors: Dict[str, str] = {}
 
         if user_input is not None:
             station_to_remove = user_input.get("station")
-            if station_to_remove and station_to_remove in self._new_stations:
+            if station_to_remove and station_to_remove in self._new_stations_set:
                 # Prevent removing the last station
                 if len(self._new_stations) <= 1:
                     errors["base"] = "cannot_remove_last"
                 else:
                     self._new_stations.remove(station_to_remove)
+                    self._new_stations_set.discard(station_to_remove)
 
                     new_data = dict(self._entry.data)
                     new_data[CONF_STATIONS] = self._new_stations
@@ -486,13 +557,15 @@ class HaMetarWeatherOptionsFlow(OptionsFlow):
 
                     return self.async_create_entry(title="", data={})
 
-        # Build station selection options
-        station_options = {station: station for station in self._new_stations}
-
         return self.async_show_form(
             step_id="station_remove",
             data_schema=vol.Schema({
-                vol.Required("station"): vol.In(station_options),
+                vol.Required("station"): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(self._new_stations),
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                ),
             }),
             errors=errors,
         )
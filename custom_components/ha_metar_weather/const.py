@@ -8,11 +8,12 @@ Constants for the METAR Weather integration.
 
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import timedelta
 from enum import StrEnum
 from pathlib import Path
-from typing import Dict, Final, Tuple
+from types import MappingProxyType
+from typing import Final, Mapping, Tuple
 
 from homeassistant.const import (
     UnitOfTemperature,
@@ -22,6 +23,8 @@ from homeassistant.const import (
     CONF_UNIT_SYSTEM_METRIC,
     CONF_UNIT_SYSTEM_IMPERIAL,
 )
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
 
 
 class TrendState(StrEnum):
@@ -51,14 +54,15 @@ CONF_ALTITUDE_UNIT: Final[str] = "altitude_unit"
 DEGREE: Final[str] = "°"
 PERCENTAGE: Final[str] = "%"
 
+MANIFEST_PATH: Final[Path] = Path(__file__).with_name("manifest.json")
+
 # Version - read from manifest.json to avoid duplication
 def _get_version() -> str:
     """Read version from manifest.json."""
     try:
-        manifest_path = Path(__file__).parent / "manifest.json"
-        manifest = json.loads(manifest_path.read_text())
+        manifest = json_loads(MANIFEST_PATH.read_bytes())
         return manifest.get("version", "0.0.0")
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (OSError, ValueError):  # unreadable file / invalid JSON (orjson)
         return "0.0.0"
 
 VERSION: Final[str] = _get_version()
@@ -70,6 +74,15 @@ DEFAULT_SCAN_INTERVAL: Final[timedelta] = timedelta(minutes=30)
 # Storage settings
 STORAGE_KEY: Final[str] = f"{DOMAIN}.history"
 
+# hass.data key for recently validated stations (ICAO -> monotonic timestamp)
+DATA_STATION_PROBES: Final[HassKey[dict[str, float]]] = HassKey(
+    f"{DOMAIN}_station_probes"
+)
+# hass.data key for station probes currently running (ICAO -> Future)
+DATA_STATION_INFLIGHT: Final[HassKey[dict[str, asyncio.Future[bool]]]] = HassKey(
+    f"{DOMAIN}_station_inflight"
+)
+
 # Unit conversion factors. Must match HA core's unit_conversion.py exactly,
 # or a stored value converted back to its source unit by core drifts off the
 # reported one (1 kt stored as 1.9 km/h displayed as "1.03 kn" - issue #7).
@@ -93,9 +106,11 @@ RETRY_INTERVALS: Final[tuple[int, ...]] = (2, 5, 10, 30)
 AWC_API_BASE_URL: Final[str] = "https://aviationweather.gov/api/data/metar"
 AWC_API_TIMEOUT: Final[int] = 30  # seconds
 AVWX_TIMEOUT: Final[int] = 30  # seconds
-
-# Validation
-ICAO_REGEX: Final[str] = r"^[A-Z0-9]{4}$"
+# How long a successful station validation is reused before probing again
+VALIDATION_CACHE_TTL: Final[int] = 60  # seconds
+# Parsed reports memoized by raw METAR string; a report is re-fetched on every
+# poll until the station issues a new one
+PARSED_METAR_CACHE_SIZE: Final[int] = 128
 
 # Attributes
 ATTR_LAST_UPDATE: Final[str] = "last_update"
@@ -108,45 +123,45 @@ ATTR_WIND_GUST: Final[str] = "wind_gust"
 ATTR_WIND_VARIABLE_DIRECTION: Final[str] = "wind_variable_direction"
 
 # Unit mappings
-UNIT_MAPPINGS: Final[Dict[str, Dict[str, str]]] = {
-    "temperature": {
+UNIT_MAPPINGS: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType({
+    "temperature": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfTemperature.CELSIUS,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfTemperature.FAHRENHEIT
-    },
-    "pressure": {
+    }),
+    "pressure": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfPressure.HPA,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfPressure.INHG
-    },
-    "wind_speed": {
+    }),
+    "wind_speed": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfSpeed.KILOMETERS_PER_HOUR,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfSpeed.MILES_PER_HOUR
-    },
-    "visibility": {
+    }),
+    "visibility": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfLength.KILOMETERS,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfLength.MILES
-    },
-    "wind_gust": {
+    }),
+    "wind_gust": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfSpeed.KILOMETERS_PER_HOUR,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfSpeed.MILES_PER_HOUR
-    },
-    "cloud_coverage_height": {
+    }),
+    "cloud_coverage_height": MappingProxyType({
         CONF_UNIT_SYSTEM_METRIC: UnitOfLength.METERS,
         CONF_UNIT_SYSTEM_IMPERIAL: UnitOfLength.FEET
-    }
-}
+    })
+})
 
 # Fixed units that don't change based on system preferences
-FIXED_UNITS: Final[Dict[str, str]] = {
+FIXED_UNITS: Final[Mapping[str, str]] = MappingProxyType({
     "wind_direction": DEGREE,
     "humidity": PERCENTAGE,
-}
+})
 
 # Internal storage precision. NOT a display precision: values are stored in
 # base units (km/h, km, hPa) at near-full precision so that HA's conversion
 # back to the unit the report used (kn, SM, inHg, m) reproduces the exact
 # reported value. 6 decimals only strips binary float noise. Rounding for
 # display happens in the frontend via suggested_display_precision (sensor.py).
-NUMERIC_PRECISION: Final[Dict[str, int]] = {
+NUMERIC_PRECISION: Final[Mapping[str, int]] = MappingProxyType({
     "temperature": 1,
     "dew_point": 1,
     "wind_speed": 6,
@@ -155,11 +170,11 @@ NUMERIC_PRECISION: Final[Dict[str, int]] = {
     "pressure": 6,
     "humidity": 1,
     "cloud_coverage_height": 0
-}
+})
 
 # Valid value ranges for measurements
 # Note: wind_speed matches parser's 200 kt limit, wind_gust matches 300 kt limit
-VALUE_RANGES: Final[Dict[str, Tuple[float, float]]] = {
+VALUE_RANGES: Final[Mapping[str, Tuple[float, float]]] = MappingProxyType({
     "temperature": (-100.0, 60.0),    # °C
     "dew_point": (-100.0, 60.0),      # °C
     "wind_speed": (0.0, 370.0),       # km/h (200 kt max from parser)
@@ -168,7 +183,7 @@ VALUE_RANGES: Final[Dict[str, Tuple[float, float]]] = {
     "pressure": (900.0, 1100.0),      # hPa
     "humidity": (0.0, 100.0),         # %
     "cloud_coverage_height": (0.0, 50000.0)  # feet
-}
+})
 
 # METAR code -> canonical, language-independent slug.
 #
@@ -179,14 +194,14 @@ VALUE_RANGES: Final[Dict[str, Tuple[float, float]]] = {
 # phase-2 localization roadmap in docs/localization-roadmap.md).
 
 # Weather intensity prefixes (moderate intensity has no marker -> no slug).
-WEATHER_INTENSITY_CODES: Final[Dict[str, str]] = {
+WEATHER_INTENSITY_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "-": "light",
     "+": "heavy",
     "VC": "vicinity",
-}
+})
 
 # Weather descriptors.
-WEATHER_DESCRIPTOR_CODES: Final[Dict[str, str]] = {
+WEATHER_DESCRIPTOR_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "MI": "shallow",
     "PR": "partial",
     "BC": "patches",
@@ -195,10 +210,10 @@ WEATHER_DESCRIPTOR_CODES: Final[Dict[str, str]] = {
     "SH": "showers",
     "TS": "thunderstorm",
     "FZ": "freezing",
-}
+})
 
 # Weather phenomena (precipitation / obscuration / other).
-WEATHER_PHENOMENON_CODES: Final[Dict[str, str]] = {
+WEATHER_PHENOMENON_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "DZ": "drizzle",
     "RA": "rain",
     "SN": "snow",
@@ -221,10 +236,10 @@ WEATHER_PHENOMENON_CODES: Final[Dict[str, str]] = {
     "FC": "funnel_cloud",
     "SS": "sandstorm",
     "DS": "duststorm",
-}
+})
 
 # Recent (RE-prefixed) weather phenomena that the parser recognises explicitly.
-RECENT_WEATHER_CODES: Final[Dict[str, str]] = {
+RECENT_WEATHER_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "RESN": "snow",
     "RERA": "rain",
     "REDZ": "drizzle",
@@ -236,10 +251,10 @@ RECENT_WEATHER_CODES: Final[Dict[str, str]] = {
     "RESH": "showers",
     "REBLSN": "blowing_snow",
     "REFG": "fog",
-}
+})
 
 # Cloud coverage code -> slug.
-CLOUD_COVERAGE: Final[Dict[str, str]] = {
+CLOUD_COVERAGE: Final[Mapping[str, str]] = MappingProxyType({
     "SKC": "clear_sky",
     "CLR": "clr",
     "NSC": "no_significant",
@@ -250,7 +265,7 @@ CLOUD_COVERAGE: Final[Dict[str, str]] = {
     "BKN": "broken",
     "OVC": "overcast",
     "VV": "vertical_visibility",
-}
+})
 
 # Closed vocabulary for the cloud_coverage_state ENUM sensor. "clear" is emitted
 # when no layers are present. "amount_unknown" comes from AUTO slash
@@ -272,7 +287,7 @@ CLOUD_COVERAGE_OPTIONS: Final[list[str]] = [
 ]
 
 # Cloud type code -> slug.
-CLOUD_TYPES: Final[Dict[str, str]] = {
+CLOUD_TYPES: Final[Mapping[str, str]] = MappingProxyType({
     "CB": "cumulonimbus",
     "TCU": "towering_cumulus",
     "CI": "cirrus",
@@ -284,13 +299,13 @@ CLOUD_TYPES: Final[Dict[str, str]] = {
     "SC": "stratocumulus",
     "ST": "stratus",
     "CU": "cumulus",
-}
+})
 
 # Closed vocabulary for the cloud_coverage_type ENUM sensor. "none" when absent.
 CLOUD_TYPE_OPTIONS: Final[list[str]] = ["none", *CLOUD_TYPES.values()]
 
 # Runway surface code -> slug.
-RUNWAY_SURFACE_CODES: Final[Dict[str, str]] = {
+RUNWAY_SURFACE_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "0": "clear_and_dry",
     "1": "damp",
     "2": "wet",
@@ -302,7 +317,7 @@ RUNWAY_SURFACE_CODES: Final[Dict[str, str]] = {
     "8": "compacted_snow",
     "9": "frozen_ruts",
     "/": "not_reported",
-}
+})
 
 # Closed vocabulary for runway surface (plus special raw groups + fallback).
 RUNWAY_SURFACE_OPTIONS: Final[list[str]] = [
@@ -313,7 +328,7 @@ RUNWAY_SURFACE_OPTIONS: Final[list[str]] = [
 ]
 
 # Runway coverage code -> slug.
-RUNWAY_COVERAGE_CODES: Final[Dict[str, str]] = {
+RUNWAY_COVERAGE_CODES: Final[Mapping[str, str]] = MappingProxyType({
     "0": "cov_0",
     "1": "cov_lt10",
     "2": "cov_11_25",
@@ -325,7 +340,7 @@ RUNWAY_COVERAGE_CODES: Final[Dict[str, str]] = {
     "8": "cov_91_100",
     "9": "cov_51_100",  # Generic 51%+ coverage
     "/": "not_reported",
-}
+})
 
 RUNWAY_COVERAGE_OPTIONS: Final[list[str]] = [
     *dict.fromkeys(RUNWAY_COVERAGE_CODES.values()),
@@ -339,7 +354,7 @@ REPORT_TYPE_OPTIONS: Final[list[str]] = ["auto", "manual"]
 CAVOK_OPTIONS: Final[list[str]] = ["yes", "no"]
 
 # Unit display formats
-UNIT_FORMATS: Final[Dict[str, str]] = {
+UNIT_FORMATS: Final[Mapping[str, str]] = MappingProxyType({
     UnitOfTemperature.CELSIUS: "°C",
     UnitOfTemperature.FAHRENHEIT: "°F",
     UnitOfLength.KILOMETERS: "km",
@@ -353,39 +368,39 @@ UNIT_FORMATS: Final[Dict[str, str]] = {
     UnitOfSpeed.MILES_PER_HOUR: "mph",
     UnitOfSpeed.KILOMETERS_PER_HOUR: "km/h",
     UnitOfSpeed.KNOTS: "kn",  # HA core's knot symbol; sensors display "kn", so the picker must match
-}
+})
 
 # Available units for user selection
-AVAILABLE_TEMP_UNITS: Final[list[str]] = [
+AVAILABLE_TEMP_UNITS: Final[tuple[str, ...]] = (
     UnitOfTemperature.CELSIUS,
     UnitOfTemperature.FAHRENHEIT,
-]
+)
 
-AVAILABLE_WIND_SPEED_UNITS: Final[list[str]] = [
+AVAILABLE_WIND_SPEED_UNITS: Final[tuple[str, ...]] = (
     UnitOfSpeed.KILOMETERS_PER_HOUR,
     UnitOfSpeed.METERS_PER_SECOND,
     UnitOfSpeed.MILES_PER_HOUR,
     UnitOfSpeed.KNOTS,
-]
+)
 
-AVAILABLE_VISIBILITY_UNITS: Final[list[str]] = [
+AVAILABLE_VISIBILITY_UNITS: Final[tuple[str, ...]] = (
     UnitOfLength.KILOMETERS,
     UnitOfLength.METERS,
     UnitOfLength.MILES,
     UnitOfLength.FEET,
-]
+)
 
-AVAILABLE_PRESSURE_UNITS: Final[list[str]] = [
+AVAILABLE_PRESSURE_UNITS: Final[tuple[str, ...]] = (
     UnitOfPressure.HPA,
     UnitOfPressure.INHG,
     UnitOfPressure.MMHG,
     # Note: MBAR is equivalent to HPA (1 mbar = 1 hPa)
-]
+)
 
-AVAILABLE_ALTITUDE_UNITS: Final[list[str]] = [
+AVAILABLE_ALTITUDE_UNITS: Final[tuple[str, ...]] = (
     UnitOfLength.FEET,
     UnitOfLength.METERS,
-]
+)
 
 # Default units (matching aviation standards)
 DEFAULT_TEMP_UNIT: Final[str] = UnitOfTemperature.CELSIUS
@@ -401,7 +416,7 @@ DEFAULT_ALTITUDE_UNIT: Final[str] = UnitOfLength.FEET
 # hundredths of a statute mile (common US fractions 1/4SM..3/4SM render
 # exactly; the rare 1/8SM and 1/16SM round to 0.12/0.06 mi - the price of
 # not showing "10.000 mi" for every clear day).
-DISPLAY_PRECISION_BY_UNIT: Final[Dict[str, int]] = {
+DISPLAY_PRECISION_BY_UNIT: Final[Mapping[str, int]] = MappingProxyType({
     UnitOfTemperature.CELSIUS: 1,
     UnitOfTemperature.FAHRENHEIT: 1,
     UnitOfSpeed.KILOMETERS_PER_HOUR: 1,
@@ -415,7 +430,7 @@ DISPLAY_PRECISION_BY_UNIT: Final[Dict[str, int]] = {
     UnitOfPressure.HPA: 1,
     UnitOfPressure.INHG: 2,
     UnitOfPressure.MMHG: 1,
-}
+})
 
 # Unit option key for "auto" (use HA system)
 UNIT_AUTO: Final[str] = "auto"
@@ -427,10 +442,10 @@ UNIT_NATIVE: Final[str] = "native"
 # is not available yet. Once a report exists, utils.detect_native_units() reads
 # the units the station itself transmits (KT vs MPS, meters vs SM, Q vs A) and
 # overrides these defaults per station.
-NATIVE_METAR_UNITS: Final[Dict[str, str]] = {
+NATIVE_METAR_UNITS: Final[Mapping[str, str]] = MappingProxyType({
     "temperature": UnitOfTemperature.CELSIUS,      # METAR always uses Celsius
     "wind_speed": UnitOfSpeed.KNOTS,               # most stations report KT
     "visibility": UnitOfLength.METERS,             # ICAO reports meters; US uses SM
     "pressure": UnitOfPressure.HPA,                # ICAO QNH (Q); US altimeter (A) is inHg
     "altitude": UnitOfLength.FEET,                 # cloud heights always in feet
-}
+})
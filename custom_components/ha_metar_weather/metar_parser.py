@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from dataclasses import dataclass
 
 from .const import (
@@ -26,6 +28,7 @@ from .const import (
     MPS_TO_KMH,
     INHG_TO_HPA,
     MILES_TO_KM,
+    PARSED_METAR_CACHE_SIZE,
 )
 from .utils import calculate_humidity, parse_runway_states_from_raw
 
@@ -39,8 +42,113 @@ TREND_BOUNDARY_TOKENS: tuple[str, ...] = (
     'TEMPO', 'BECMG', 'NOSIG', 'RMK', 'FM', 'PROB30', 'PROB40'
 )
 
+# Cloud layer groups (FEW020, BKN040CB). Tuples so str.startswith() tests all
+# prefixes in one call.
+CLOUD_LAYER_PREFIXES: tuple[str, ...] = ('FEW', 'SCT', 'BKN', 'OVC')
+# Groups that follow visibility in the body; reaching one ends the search.
+VISIBILITY_STOP_PREFIXES: tuple[str, ...] = (
+    *CLOUD_LAYER_PREFIXES, 'SKC', 'CLR', 'NSC', 'VV'
+)
+# Clear-sky groups, each reported as a single cloud "layer".
+CLEAR_SKY_TOKENS: frozenset[str] = frozenset({'SKC', 'CLR', 'NSC', 'NCD', 'CAVOK'})
+# Whole tokens that can never be a present-weather group.
+NON_WEATHER_TOKENS: frozenset[str] = frozenset({
+    'NOSIG', 'TL', 'AT', 'AUTO', 'COR', *CLEAR_SKY_TOKENS
+})
+
+# Wind groups: 13008KT, 13008G15KT, VRB03KT, 24005MPS; variation 180V240.
+# Matched with fullmatch(): a group with trailing characters is rejected
+# outright instead of matching a prefix.
+_WIND_GROUP_RE = re.compile(
+    r'(?P<direction>\d{3}|VRB)(?P<speed>\d{2,3})(?:G(?P<gust>\d{2,3}))?'
+    r'(?P<unit>KT|MPS)'
+)
+_WIND_VARIATION_RE = re.compile(r'(\d{2,3})V(\d{2,3})')
+
+
+@dataclass(frozen=True, slots=True)
+class _WindUnit:
+    """How to read wind groups reported in one unit."""
+    code: str  # group suffix, as reported
+    label: str  # unit name in log messages
+    to_kmh: float
+    max_speed: int  # reasonable maximum for the sustained speed
+    max_gust: int
+
+
+# Wind group units by suffix; the unit picks conversion factor and limits.
+_WIND_UNITS: Mapping[str, _WindUnit] = MappingProxyType({
+    'KT': _WindUnit('KT', 'kt', KNOTS_TO_KMH, 200, 300),
+    'MPS': _WindUnit('MPS', 'm/s', MPS_TO_KMH, 100, 150),
+})
+
+# Candidates in the visibility search after the wind group, in one pattern:
+# wind variation 180V240 (skipped), meters 9999 / 9999NDV / 3000NE, statute
+# miles 10SM / P6SM, fractional miles 1/2SM / M1/4SM.
+_VISIBILITY_RE = re.compile(
+    r'(?:(?P<variation>\d{3}V\d{3})'
+    r'|(?P<meters>\d{4})(?:(?P<ndv>NDV)|(?P<direction>[NSEW]{1,2}))?'
+    r'|P?(?P<miles>\d+)SM'
+    r'|M?(?P<numerator>\d+)/(?P<denominator>\d+)SM)$'
+)
+_VISIBILITY_FIRST_CHARS = frozenset('0123456789PM')
+
+# Altimeter groups count hundredths of inHg (A2992 = 29.92 inHg).
+_INHG_HUNDREDTHS_TO_HPA = INHG_TO_HPA / 100
+
+# AUTO-station cloud placeholders: //////, ///015, //////CB.
+_UNKNOWN_AMOUNT_CLOUD_RE = re.compile(r'/{3}(\d{3}|/{3})((?:CB|TCU)?)/{0,3}')
+# Trend section boundaries within the raw report.
+_RMK_RE = re.compile(r'\bRMK\b')
+_TREND_CHANGE_RE = re.compile(r'\b(?:TEMPO|BECMG)\b')
+
+
+def _empty_parsed_data() -> Dict[str, Any]:
+    """Result of get_parsed_data() for an empty report.
+
+    Built fresh on each call: the list/dict values must not be shared between
+    results, since callers (api_client) update the returned data in place.
+    """
+    return {
+        "raw_metar": "",
+        "station_name": None,
+        "cloud_layers": [],
+        "cloud_coverage_state": "clear",
+        "cloud_coverage_height": None,
+        "cloud_coverage_type": "none",
+        "weather": "clear",
+        "weather_groups": [],
+        "trend": None,
+        "runway_states": {},
+        "temperature": None,
+        "dew_point": None,
+        "humidity": None,
+        "wind_speed": None,
+        "wind_direction": None,
+        "wind_gust": None,
+        "wind_variable_direction": None,
+        "visibility": None,
+        "pressure": None,
+        "cavok": False,
+        "auto": False,
+    }
+
+
+def _parse_metar_temp(value: str) -> Optional[float]:
+    """Parse one half of a temp/dew group (12, M05, M00); None if malformed."""
+    # At most three characters including the M sign, so 4-digit visibility
+    # pairs (1200/0800) are rejected.
+    if not 0 < len(value) <= 3:
+        return None
+    negative = value[0] == 'M'
+    digits = value[1:] if negative else value
+    if not digits.isdecimal():
+        return None
+    # float() keeps M00 as -0.0 (just below zero), as reported
+    return -float(digits) if negative else float(digits)
+
 
-@dataclass
+@dataclass(slots=True)
 class CloudLayer:
     """Represents a cloud layer in METAR."""
     coverage: str
@@ -56,7 +164,15 @@ class CloudLayer:
             parts.append(self.type)
         return " ".join(parts)
 
-@dataclass
+@dataclass(slots=True)
+class WindData:
+    """Wind fields read from the wind and variation groups."""
+    speed: Optional[float] = None
+    direction: Optional[float] = None
+    gust: Optional[float] = None
+    variable: Optional[str] = None
+
+@dataclass(slots=True)
 class RunwayState:
     """Represents runway state in METAR."""
     surface: str
@@ -94,7 +210,10 @@ class MetarParser:
         # Caches for expensive parsing operations
         self._cloud_layers_cache: Optional[List[CloudLayer]] = None
         self._runway_states_cache: Optional[Dict[str, RunwayState]] = None
+        # Plain-dict form of the runway states, as parsed by the shared helper
+        self._runway_state_dicts: Dict[str, Dict[str, Any]] = {}
         self._body_parts_cache: Optional[List[str]] = None
+        self._weather_groups_cache: Optional[List[Dict[str, Any]]] = None
         if not self.raw_metar:
             _LOGGER.warning("Empty raw METAR string received, parsing may be incomplete")
         else:
@@ -122,24 +241,30 @@ class MetarParser:
             return self._cloud_layers_cache
 
         layers = []
+        # Bound once; looked up for every cloud group in the loop
+        coverage_get = self.CLOUD_COVERAGE.get
+        type_get = self.CLOUD_TYPES.get
+        # Checked once instead of per-group logger dispatch
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         try:
             # Search the current-conditions body for cloud information
             for part in self._body_parts():
                 # Standard cloud layers: FEW, SCT, BKN, OVC
-                if any(part.startswith(prefix) for prefix in ['FEW', 'SCT', 'BKN', 'OVC']):
+                if part.startswith(CLOUD_LAYER_PREFIXES):
                     coverage_code = part[:3]
-                    coverage = self.CLOUD_COVERAGE.get(coverage_code, coverage_code)
+                    coverage = coverage_get(coverage_code, coverage_code)
 
-                    # Extract height (next 3 digits after code)
+                    # Extract height (next 3 digits after code); sliced once
                     height = None
-                    if len(part) >= 6 and part[3:6].isdigit():
-                        height = int(part[3:6]) * 100  # Multiply by 100 to get feet
+                    height_code = part[3:6]
+                    if len(height_code) == 3 and height_code.isdecimal():
+                        height = int(height_code) * 100  # Multiply by 100 to get feet
 
                     # Determine cloud type (if present)
                     cloud_type = None
                     if len(part) > 6:
                         type_code = part[6:]
-                        cloud_type = self.CLOUD_TYPES.get(type_code)
+                        cloud_type = type_get(type_code)
 
                     layer = CloudLayer(
                         coverage=coverage,
@@ -147,41 +272,45 @@ class MetarParser:
                         type=cloud_type
                     )
                     layers.append(layer)
-                    _LOGGER.debug("Parsed cloud layer: %s at %s feet", coverage, height)
+                    if debug:
+                        _LOGGER.debug("Parsed cloud layer: %s at %s feet", coverage, height)
 
                 # Clear sky indicators: SKC, CLR, NSC, NCD, CAVOK
-                elif part in ['SKC', 'CLR', 'NSC', 'NCD', 'CAVOK']:
-                    coverage = self.CLOUD_COVERAGE.get(part, part)
+                elif part in CLEAR_SKY_TOKENS:
+                    coverage = coverage_get(part, part)
                     layer = CloudLayer(coverage=coverage, height=None, type=None)
                     layers.append(layer)
-                    _LOGGER.debug("Parsed clear sky indicator: %s", part)
+                    if debug:
+                        _LOGGER.debug("Parsed clear sky indicator: %s", part)
 
                 # AUTO stations with a failed or partial ceilometer transmit
                 # slash placeholders: ////// (no cloud data), ///015 (amount
                 # unknown, base 1500 ft), //////CB (convection detected by
                 # another sensor). Dropping them would misreport clear sky.
                 elif part.startswith('///'):
-                    m = re.fullmatch(r'/{3}(\d{3}|/{3})((?:CB|TCU)?)/{0,3}', part)
+                    m = _UNKNOWN_AMOUNT_CLOUD_RE.fullmatch(part)
                     if m:
                         height = (
                             int(m.group(1)) * 100 if m.group(1).isdigit() else None
                         )
                         cloud_type = (
-                            self.CLOUD_TYPES.get(m.group(2)) if m.group(2) else None
+                            type_get(m.group(2)) if m.group(2) else None
                         )
                         layers.append(CloudLayer(
                             coverage="amount_unknown",
                             height=height,
                             type=cloud_type,
                         ))
-                        _LOGGER.debug("Parsed unknown-amount cloud group: %s", part)
+                        if debug:
+                            _LOGGER.debug("Parsed unknown-amount cloud group: %s", part)
 
                 # Vertical Visibility (VV): used for fog/obscuration (e.g., VV002 = 200ft, VV/// = undefined)
                 elif part.startswith('VV'):
                     height_str = part[2:5] if len(part) >= 5 else part[2:]
                     # Skip malformed VV data (e.g., just "VV" with no value)
                     if not height_str:
-                        _LOGGER.debug("Skipping malformed VV data: %s", part)
+                        if debug:
+                            _LOGGER.debug("Skipping malformed VV data: %s", part)
                         continue
                     if height_str == '///':
                         # VV/// means vertical visibility cannot be determined
@@ -191,7 +320,8 @@ class MetarParser:
                             type=None
                         )
                         layers.append(layer)
-                        _LOGGER.debug("Parsed vertical visibility: undefined (VV///)")
+                        if debug:
+                            _LOGGER.debug("Parsed vertical visibility: undefined (VV///)")
                     elif height_str.isdigit():
                         height = int(height_str) * 100  # VV002 = 200 feet
                         layer = CloudLayer(
@@ -200,7 +330,8 @@ class MetarParser:
                             type=None
                         )
                         layers.append(layer)
-                        _LOGGER.debug("Parsed vertical visibility: %s feet", height)
+                        if debug:
+                            _LOGGER.debug("Parsed vertical visibility: %s feet", height)
 
             self._cloud_layers_cache = layers
             return layers
@@ -224,6 +355,7 @@ class MetarParser:
 
         # Use shared parsing function and convert to RunwayState dataclasses
         raw_states = parse_runway_states_from_raw(self.raw_metar)
+        self._runway_state_dicts = raw_states
         self._runway_states_cache = {
             runway: RunwayState(
                 surface=state["surface"],
@@ -236,6 +368,15 @@ class MetarParser:
         }
         return self._runway_states_cache
 
+    def _runway_states_as_dicts(self) -> Dict[str, Dict[str, Any]]:
+        """Runway states as plain dicts (the shape AWC data uses).
+
+        Reuses the dicts the shared parser produced instead of projecting
+        each RunwayState back into a new dict.
+        """
+        self.parse_runway_states()
+        return self._runway_state_dicts
+
     def parse_weather_groups(self) -> List[Dict[str, Any]]:
         """Parse weather phenomena into structured groups of canonical slugs.
 
@@ -243,7 +384,13 @@ class MetarParser:
         "phenomena": [slug, ...], "recent": bool, "raw": str}``. Current-condition
         groups come first, recent (RE-prefixed) groups last. CAVOK yields no
         groups (no significant weather).
+
+        Results are cached: get_parsed_data() reads the groups both directly
+        and through parse_weather().
         """
+        if self._weather_groups_cache is not None:
+            return self._weather_groups_cache
+
         groups: List[Dict[str, Any]] = []
         try:
             # Body only: a trend section may carry its own CAVOK or weather
@@ -251,29 +398,40 @@ class MetarParser:
             parts = self._body_parts()
 
             if "CAVOK" in parts:
-                return []
+                self._weather_groups_cache = groups
+                return groups
 
+            # A group is derived from its raw token alone, so equal tokens give
+            # equal groups; dedupe on the token instead of comparing dicts.
+            seen_raw: set[str] = set()
             for original_part in parts:
+                # Weather groups open with an intensity sign or a letter. The
+                # digit-led majority (time, wind, visibility, temperature) is
+                # rejected on the first character, before the checks below.
+                first = original_part[0]
+                if first.isdigit():
+                    continue
                 # Skip non-weather tokens. Runway groups (R24L/550362) are caught
                 # by the '/' check; do NOT skip a leading 'R' (RA = rain).
-                if (original_part.endswith('KT') or original_part.endswith('MPS') or
-                        '/' in original_part or original_part.startswith('Q') or
-                        original_part.isdigit() or
-                        original_part in ('NOSIG', 'CAVOK')):
+                if (first == 'Q' or original_part.endswith(('KT', 'MPS')) or
+                        '/' in original_part or
+                        original_part in NON_WEATHER_TOKENS):
                     continue
-                if (original_part.startswith('A') and len(original_part) == 5 and
+                if (first == 'A' and len(original_part) == 5 and
                         original_part[1:].isdigit()):
                     continue
-                if original_part in ('TL', 'AT', 'SKC', 'CLR', 'NSC', 'NCD', 'AUTO', 'COR'):
-                    continue
 
+                if original_part in seen_raw:
+                    continue
                 group = self._parse_weather_group(original_part)
-                if group and group not in groups:
+                if group:
+                    seen_raw.add(original_part)
                     groups.append(group)
 
-            # Recent weather (RE-prefixed) - exact token match.
+            # Recent weather (RE-prefixed) - exact token match, in table order.
+            tokens = set(parts)
             for code, slug in RECENT_WEATHER_CODES.items():
-                if code in parts:
+                if code in tokens:
                     groups.append({
                         "intensity": None,
                         "descriptor": None,
@@ -283,6 +441,7 @@ class MetarParser:
                     })
 
             _LOGGER.debug("Parsed weather groups: %s from METAR: %s", groups, self.raw_metar)
+            self._weather_groups_cache = groups
             return groups
 
         except Exception as err:
@@ -303,13 +462,17 @@ class MetarParser:
             intensity = self.WEATHER_INTENSITY_CODES.get('VC')
             remaining = remaining[2:]
 
+        # Bound once; the loop below runs per two-letter code.
+        descriptor_get = self.WEATHER_DESCRIPTOR_CODES.get
+        phenomenon_get = self.WEATHER_PHENOMENON_CODES.get
         while len(remaining) >= 2:
             code = remaining[:2]
-            if code in self.WEATHER_DESCRIPTOR_CODES:
-                descriptor = self.WEATHER_DESCRIPTOR_CODES[code]
+            # One dict access per table; codes are uppercase METAR tokens.
+            if (slug := descriptor_get(code)) is not None:
+                descriptor = slug
                 remaining = remaining[2:]
-            elif code in self.WEATHER_PHENOMENON_CODES:
-                phenomena.append(self.WEATHER_PHENOMENON_CODES[code])
+            elif (slug := phenomenon_get(code)) is not None:
+                phenomena.append(slug)
                 remaining = remaining[2:]
             else:
                 # Unknown trailing code - stop parsing this group.
@@ -355,14 +518,14 @@ class MetarParser:
         try:
             # Trend groups appear before any RMK section; drop remarks first so a
             # TEMPO/BECMG token inside RMK is not mistaken for a trend.
-            body = re.split(r'\bRMK\b', self.raw_metar)[0]
+            body = _RMK_RE.split(self.raw_metar, 1)[0]
 
             # NOSIG (No Significant Change) - kept as the raw, language-neutral code.
-            if 'NOSIG' in body:
+            if 'NOSIG' in body.split():
                 return "NOSIG"
 
             # TEMPO / BECMG forecast segment - return from the keyword to the end
-            match = re.search(r'\b(?:TEMPO|BECMG)\b', body)
+            match = _TREND_CHANGE_RE.search(body)
             if not match:
                 return None
 
@@ -408,6 +571,10 @@ class MetarParser:
 
     def get_parsed_data(self) -> Dict[str, Any]:
         """Return complete parsed METAR data."""
+        if not self.raw_metar:
+            # Nothing to parse (already warned about in __init__)
+            return _empty_parsed_data()
+
         # Current conditions end where the trend/remarks sections begin. A
         # BECMG/TEMPO group may carry its own wind (BECMG 31010KT), visibility
         # or pressure; scanning past the boundary would let a *forecast* value
@@ -417,33 +584,52 @@ class MetarParser:
         # Determine CAVOK status (current conditions only)
         cavok = "CAVOK" in body_parts
 
+        # Locate the wind group once: the wind parser reads it (and the
+        # variation group right after it), the visibility search starts there.
+        # Any KT/MPS token anchors the search, even a malformed one the wind
+        # parser rejects (1308KT). The station code is skipped, after an
+        # optional METAR/SPECI prefix: PAKT ends in KT too.
+        station_index = 1 if body_parts and body_parts[0] in ('METAR', 'SPECI') else 0
+        wind_index = next(
+            (
+                i for i, part in enumerate(body_parts[station_index + 1:], station_index + 1)
+                if part.endswith(('KT', 'MPS'))
+            ),
+            -1,
+        )
+
         # Parse wind data
-        wind_data = self._parse_wind(body_parts)
+        if wind_index >= 0:
+            wind_data = self._parse_wind(
+                body_parts[wind_index],
+                body_parts[wind_index + 1] if wind_index + 1 < len(body_parts) else None,
+            )
+        else:
+            wind_data = self._parse_wind(None)
+
+        # Temperature/dew point and pressure follow the wind group, so their
+        # scans skip the tokens already consumed (station, time, wind). With
+        # no wind group found (-1) they see the whole body.
+        after_wind = body_parts[wind_index + 1:]
 
         # Parse temperature and dew point
-        temp, dew = self._parse_temp_dew(body_parts)
+        temp, dew = self._parse_temp_dew(after_wind)
 
         # Parse pressure
-        pressure = self._parse_pressure(body_parts)
+        pressure = self._parse_pressure(after_wind)
 
         # Calculate humidity
         humidity = self._calculate_humidity(temp, dew)
 
         # Parse cloud data
         cloud_layers = self.parse_cloud_layers()
+        first_layer = cloud_layers[0] if cloud_layers else None
 
         # Process visibility
         visibility = None
         if cavok:
             visibility = 10.0  # CAVOK means 10 km visibility
         else:
-            # Find the wind part index to start looking for visibility after it
-            wind_index = -1
-            for i, part in enumerate(body_parts):
-                if part.endswith('KT') or part.endswith('MPS'):
-                    wind_index = i
-                    break
-
             # If no wind found, start searching from position 2 (after station code and time)
             # METAR format: ICAO TIME [WIND] VISIBILITY ...
             if wind_index < 0:
@@ -455,65 +641,68 @@ class MetarParser:
                 # Limit search to prevent matching unrelated 4-digit numbers later in METAR
                 max_visibility_search = min(wind_index + 4, len(body_parts))
 
-                for idx, part in enumerate(body_parts[wind_index + 1:max_visibility_search]):
-                    # Skip variable wind direction (e.g., 180V240)
-                    if re.match(r'^\d{3}V\d{3}$', part):
-                        continue
-
+                # Fast path: in most reports the token right after the wind
+                # is plain 4-digit meters (9999, 0800); no search needed.
+                first = (
+                    body_parts[wind_index + 1]
+                    if wind_index + 1 < max_visibility_search else ""
+                )
+                if len(first) == 4 and first.isdecimal():
+                    vis_meters = int(first)
+                    if vis_meters == 9999:
+                        visibility = 10.0  # 9999 means 10 km or more
+                    else:
+                        visibility = vis_meters / 1000  # Convert meters to kilometers
+                    _LOGGER.debug("Parsed visibility: %s meters = %s km", vis_meters, visibility)
+                    candidates: List[str] = []
+                else:
+                    candidates = body_parts[wind_index + 1:max_visibility_search]
+
+                for idx, part in enumerate(candidates):
                     # Skip runway conditions (e.g., R24L/..., R09/...)
-                    if part.startswith('R') and '/' in part:
+                    if part[0] == 'R' and '/' in part:
                         continue
 
-                    # Check for 4-digit visibility in meters (e.g., 9999, 7000, 0800)
-                    # Valid visibility range: 0000-9999 meters
-                    if re.match(r'^\d{4}$', part):
-                        vis_meters = int(part)
-                        if vis_meters == 9999:
-                            visibility = 10.0  # 9999 means 10 km or more
-                        else:
-                            visibility = vis_meters / 1000  # Convert meters to kilometers
-                        _LOGGER.debug("Parsed visibility: %s meters = %s km", vis_meters, visibility)
-                        break
-
-                    # Check for visibility with NDV (no directional variation) suffix
-                    ndv_match = re.match(r'^(\d{4})NDV$', part)
-                    if ndv_match:
-                        vis_meters = int(ndv_match.group(1))
-                        if vis_meters == 9999:
-                            visibility = 10.0
-                        else:
-                            visibility = vis_meters / 1000
-                        _LOGGER.debug("Parsed NDV visibility: %s meters = %s km", vis_meters, visibility)
-                        break
-
-                    # Check for visibility with direction (e.g., 3000NE, 1500S, 0800SW)
-                    dir_match = re.match(r'^(\d{4})([NSEW]{1,2})$', part)
-                    if dir_match:
-                        vis_meters = int(dir_match.group(1))
-                        direction = dir_match.group(2)
-                        if vis_meters == 9999:
-                            visibility = 10.0
-                        else:
-                            visibility = vis_meters / 1000
-                        _LOGGER.debug("Parsed directional visibility: %s meters %s = %s km",
-                                    vis_meters, direction, visibility)
-                        break
+                    # Every visibility form starts with a digit, P or M; other
+                    # tokens skip the regex and go straight to the stop check.
+                    vis_match = (
+                        _VISIBILITY_RE.match(part)
+                        if part[0] in _VISIBILITY_FIRST_CHARS else None
+                    )
+                    if vis_match is not None:
+                        # Skip variable wind direction (e.g., 180V240)
+                        if vis_match['variation']:
+                            continue
 
-                    # Check for SM (statute miles) format - US METAR (e.g., 10SM, 3SM, P6SM)
-                    sm_match = re.match(r'^P?(\d+)SM$', part)
-                    if sm_match:
-                        vis_miles = float(sm_match.group(1))
-                        visibility = round(vis_miles * MILES_TO_KM, 6)
-                        _LOGGER.debug("Parsed SM visibility: %s SM = %s km", vis_miles, visibility)
-                        break
+                        # 4-digit visibility in meters (e.g., 9999, 7000, 0800),
+                        # optionally with NDV or a direction (3000NE, 0800SW)
+                        if vis_match['meters']:
+                            vis_meters = int(vis_match['meters'])
+                            if vis_meters == 9999:
+                                visibility = 10.0  # 9999 means 10 km or more
+                            else:
+                                visibility = vis_meters / 1000  # Convert meters to kilometers
+                            if vis_match['ndv']:
+                                _LOGGER.debug("Parsed NDV visibility: %s meters = %s km", vis_meters, visibility)
+                            elif vis_match['direction']:
+                                _LOGGER.debug("Parsed directional visibility: %s meters %s = %s km",
+                                            vis_meters, vis_match['direction'], visibility)
+                            else:
+                                _LOGGER.debug("Parsed visibility: %s meters = %s km", vis_meters, visibility)
+                            break
 
-                    # Check for fractional SM format (e.g., 1/2SM, M1/4SM, 3/4SM).
-                    # M prefix = "less than"; report the boundary value.
-                    # Also handles mixed fractions where previous part is whole number
-                    frac_sm_match = re.match(r'^M?(\d+)/(\d+)SM$', part)
-                    if frac_sm_match:
-                        numerator = float(frac_sm_match.group(1))
-                        denominator = float(frac_sm_match.group(2))
+                        # SM (statute miles) format - US METAR (e.g., 10SM, 3SM, P6SM)
+                        if vis_match['miles']:
+                            vis_miles = float(vis_match['miles'])
+                            visibility = round(vis_miles * MILES_TO_KM, 6)
+                            _LOGGER.debug("Parsed SM visibility: %s SM = %s km", vis_miles, visibility)
+                            break
+
+                        # Fractional SM format (e.g., 1/2SM, M1/4SM, 3/4SM).
+                        # M prefix = "less than"; report the boundary value.
+                        # Also handles mixed fractions where previous part is whole number
+                        numerator = float(vis_match['numerator'])
+                        denominator = float(vis_match['denominator'])
                         if denominator > 0:
                             vis_miles = numerator / denominator
 
@@ -537,8 +726,8 @@ class MetarParser:
                         break
 
                     # Stop at cloud, temperature, or pressure parts
-                    if (part.startswith(('FEW', 'SCT', 'BKN', 'OVC', 'SKC', 'CLR', 'NSC', 'VV')) or
-                        '/' in part or part.startswith('Q') or part.startswith('A')):
+                    if (part[0] == 'Q' or part[0] == 'A' or '/' in part or
+                        part.startswith(VISIBILITY_STOP_PREFIXES)):
                         break
 
         # Parse weather phenomena using the proper method that handles intensity
@@ -548,12 +737,10 @@ class MetarParser:
         # airport name (when the data source provides one) is layered in by the
         # api_client after parsing.
         station_name = None
-        if self.raw_metar:
-            parts = self.raw_metar.split()
-            if parts:
-                icao = parts[0]
-                if len(icao) == 4 and icao.isalnum():
-                    station_name = icao
+        if body_parts:
+            icao = body_parts[0]
+            if len(icao) == 4 and icao.isalnum():
+                station_name = icao
 
         data = {
             "raw_metar": self.raw_metar,
@@ -563,252 +750,179 @@ class MetarParser:
                 {"coverage": l.coverage, "height": l.height, "type": l.type}
                 for l in cloud_layers
             ],
-            "cloud_coverage_state": self.parse_cloud_coverage(),
-            "cloud_coverage_height": self.parse_cloud_height(),
-            "cloud_coverage_type": self.parse_cloud_type(),
+            # Summary fields of the first layer, as parse_cloud_coverage /
+            # _height / _type report them
+            "cloud_coverage_state": first_layer.coverage if first_layer else "clear",
+            "cloud_coverage_height": first_layer.height if first_layer else None,
+            "cloud_coverage_type": (
+                first_layer.type if first_layer and first_layer.type else "none"
+            ),
             "weather": weather_description,
             "weather_groups": self.parse_weather_groups(),
             "trend": self.parse_trend(),
-            "runway_states": {rwy: state.__dict__ for rwy, state in self.parse_runway_states().items()},
+            "runway_states": self._runway_states_as_dicts(),
             "temperature": temp,
             "dew_point": dew,
             "humidity": humidity,
-            "wind_speed": wind_data["speed"],
-            "wind_direction": wind_data["direction"],
-            "wind_gust": wind_data["gust"],
-            "wind_variable_direction": wind_data["variable"],
+            "wind_speed": wind_data.speed,
+            "wind_direction": wind_data.direction,
+            "wind_gust": wind_data.gust,
+            "wind_variable_direction": wind_data.variable,
             "visibility": visibility,
             "pressure": pressure,
             "cavok": cavok,
-            # Parse AUTO from raw METAR (AVWX doesn't have .auto attribute)
-            "auto": "AUTO" in self.raw_metar,
+            # Parse AUTO from raw METAR (AVWX doesn't have .auto attribute);
+            # a whole-token check, so remark text can't trip it.
+            "auto": "AUTO" in body_parts,
         }
 
         _LOGGER.debug("Parsed METAR data: %s", data)
         return data
 
-    def _parse_wind(self, raw_parts: List[str]) -> Dict[str, Optional[Union[float, str]]]:
-        """Parse wind information from METAR."""
-        result: Dict[str, Optional[Union[float, str]]] = {
-            "speed": None,
-            "direction": None,
-            "gust": None,
-            "variable": None
-        }
-
-        try:
-            for part in raw_parts:
-                # Parse main wind information (direction and speed)
-                if 'KT' in part:
-                    # Handle VRB (variable) wind direction: VRB03KT, VRB03G10KT
-                    vrb_match = re.match(r'VRB(\d{2,3})(?:G(\d{2,3}))?KT', part)
-                    if vrb_match:
-                        speed_kt = int(vrb_match.group(1))
-
-                        # Variable wind direction - set to None but mark as variable
-                        result["direction"] = None
-                        result["variable"] = "VRB"
-
-                        # Validate wind speed
-                        if 0 <= speed_kt <= 200:  # reasonable maximum for knots
-                            result["speed"] = round(speed_kt * KNOTS_TO_KMH, 6)
-                        else:
-                            _LOGGER.warning("Invalid wind speed: %s kt", speed_kt)
-                            continue
-
-                        if vrb_match.group(2):
-                            gust_kt = int(vrb_match.group(2))
-                            if 0 <= gust_kt <= 300:  # reasonable maximum for gusts
-                                result["gust"] = round(gust_kt * KNOTS_TO_KMH, 6)
-                            else:
-                                _LOGGER.warning("Invalid wind gust: %s kt", gust_kt)
+    def _parse_wind(
+        self, wind_part: Optional[str], variation_part: Optional[str] = None
+    ) -> WindData:
+        """Parse wind information from METAR.
 
-                        _LOGGER.debug(
-                            "Parsed VRB KT wind: variable direction at %s kt (%s km/h)",
-                            speed_kt,
-                            result["speed"]
-                        )
-                        continue
-
-                    # Handle standard wind direction: 13008KT, 13008G15KT
-                    match = re.match(r'(\d{3})(\d{2,3})(?:G(\d{2,3}))?KT', part)
-                    if match:
-                        direction = int(match.group(1))
-                        speed_kt = int(match.group(2))
-
-                        # Handle calm wind (00000KT) - direction has no meaning
-                        if speed_kt == 0 and direction == 0:
-                            result["direction"] = None
-                            result["speed"] = 0.0
-                            _LOGGER.debug("Parsed calm wind: 00000KT")
-                            continue
-
-                        # Validate wind direction
-                        if 0 <= direction <= 360:
-                            result["direction"] = float(direction)
-                        else:
-                            _LOGGER.warning("Invalid wind direction: %s°", direction)
-                            continue
-
-                        # Validate wind speed
-                        if 0 <= speed_kt <= 200:  # reasonable maximum for knots
-                            result["speed"] = round(speed_kt * KNOTS_TO_KMH, 6)
-                        else:
-                            _LOGGER.warning("Invalid wind speed: %s kt", speed_kt)
-                            continue
-
-                        if match.group(3):
-                            gust_kt = int(match.group(3))
-                            if 0 <= gust_kt <= 300:  # reasonable maximum for gusts
-                                result["gust"] = round(gust_kt * KNOTS_TO_KMH, 6)
-                            else:
-                                _LOGGER.warning("Invalid wind gust: %s kt", gust_kt)
-
-                        _LOGGER.debug(
-                            "Parsed KT wind: %s° at %s kt (%s km/h)",
-                            direction,
-                            speed_kt,
-                            result["speed"]
-                        )
-
-                elif 'MPS' in part:
-                    # Handle VRB (variable) wind direction: VRB03MPS, VRB03G10MPS
-                    vrb_match = re.match(r'VRB(\d{2,3})(?:G(\d{2,3}))?MPS', part)
-                    if vrb_match:
-                        speed_ms = int(vrb_match.group(1))
-
-                        # Variable wind direction - set to None but mark as variable
-                        result["direction"] = None
-                        result["variable"] = "VRB"
-
-                        # Validate wind speed
-                        if 0 <= speed_ms <= 100:  # reasonable maximum for m/s
-                            result["speed"] = round(speed_ms * MPS_TO_KMH, 6)
-                        else:
-                            _LOGGER.warning("Invalid wind speed: %s m/s", speed_ms)
-                            continue
-
-                        if vrb_match.group(2):
-                            gust_ms = int(vrb_match.group(2))
-                            if 0 <= gust_ms <= 150:  # reasonable maximum for gusts in m/s
-                                result["gust"] = round(gust_ms * MPS_TO_KMH, 6)
-                            else:
-                                _LOGGER.warning("Invalid wind gust: %s m/s", gust_ms)
+        Takes the wind group itself and the token right after it, where a
+        direction variation group (180V240) is reported.
+        """
+        result = WindData()
+
+        if wind_part is not None:
+            self._parse_wind_group(wind_part, result)
+
+        # Parse variable wind direction (format: 180V240 or 10V90)
+        # Cheap shape test first (V after 2-3 digits); the token here is
+        # usually visibility (9999, 3000NE) and never reaches the regex
+        if (variation_part and 5 <= len(variation_part) <= 7
+                and 'V' in variation_part[2:4]):
+            match = _WIND_VARIATION_RE.fullmatch(variation_part)
+            if match:
+                start_dir = int(match.group(1))
+                end_dir = int(match.group(2))
+
+                # Validate directions
+                if 0 <= start_dir <= 360 and 0 <= end_dir <= 360:
+                    result.variable = f"{start_dir:03d}°-{end_dir:03d}°"
+                    _LOGGER.debug("Parsed variable wind direction: %s", result.variable)
+                else:
+                    _LOGGER.warning("Invalid variable wind directions: %s-%s", start_dir, end_dir)
 
-                        _LOGGER.debug(
-                            "Parsed VRB MPS wind: variable direction at %s m/s (%s km/h)",
-                            speed_ms,
-                            result["speed"]
-                        )
-                        continue
+        return result
 
-                    # Handle standard wind direction: 13008MPS, 13008G15MPS
-                    match = re.match(r'(\d{3})(\d{2,3})(?:G(\d{2,3}))?MPS', part)
-                    if match:
-                        direction = int(match.group(1))
-                        speed_ms = int(match.group(2))
-
-                        # Handle calm wind (00000MPS) - direction has no meaning
-                        if speed_ms == 0 and direction == 0:
-                            result["direction"] = None
-                            result["speed"] = 0.0
-                            _LOGGER.debug("Parsed calm wind: 00000MPS")
-                            continue
+    @staticmethod
+    def _parse_wind_group(
+        part: str, result: WindData
+    ) -> None:
+        """Fill ``result`` from a wind group (13008KT, VRB03G10MPS)."""
+        # One pattern for all four shapes; the unit group picks the factor
+        match = _WIND_GROUP_RE.fullmatch(part)
+        if not match:
+            return
+        unit = _WIND_UNITS[match['unit']]
+        speed = int(match['speed'])
+        gust_code = match['gust']
+
+        # Handle VRB (variable) wind direction: VRB03KT, VRB03G10MPS
+        if match['direction'] == 'VRB':
+            # Variable wind direction - set to None but mark as variable
+            result.direction = None
+            result.variable = "VRB"
+
+            # Validate wind speed
+            if 0 <= speed <= unit.max_speed:
+                result.speed = round(speed * unit.to_kmh, 6)
+            else:
+                _LOGGER.warning("Invalid wind speed: %s %s", speed, unit.label)
+                return
+
+            if gust_code:
+                gust = int(gust_code)
+                if 0 <= gust <= unit.max_gust:
+                    result.gust = round(gust * unit.to_kmh, 6)
+                else:
+                    _LOGGER.warning("Invalid wind gust: %s %s", gust, unit.label)
+
+            _LOGGER.debug(
+                "Parsed VRB %s wind: variable direction at %s %s (%s km/h)",
+                unit.code,
+                speed,
+                unit.label,
+                result.speed
+            )
+            return
 
-                        # Validate wind direction
-                        if 0 <= direction <= 360:
-                            result["direction"] = float(direction)
-                        else:
-                            _LOGGER.warning("Invalid wind direction: %s°", direction)
-                            continue
+        # Handle standard wind direction: 13008KT, 13008G15MPS
+        direction = int(match['direction'])
 
-                        # Validate wind speed
-                        if 0 <= speed_ms <= 100:  # reasonable maximum for m/s
-                            result["speed"] = round(speed_ms * MPS_TO_KMH, 6)
-                        else:
-                            _LOGGER.warning("Invalid wind speed: %s m/s", speed_ms)
-                            continue
+        # Handle calm wind (00000KT) - direction has no meaning
+        if speed == 0 and direction == 0:
+            result.direction = None
+            result.speed = 0.0
+            _LOGGER.debug("Parsed calm wind: 00000%s", unit.code)
+            return
 
-                        if match.group(3):
-                            gust_ms = int(match.group(3))
-                            if 0 <= gust_ms <= 150:  # reasonable maximum for gusts in m/s
-                                result["gust"] = round(gust_ms * MPS_TO_KMH, 6)
-                            else:
-                                _LOGGER.warning("Invalid wind gust: %s m/s", gust_ms)
+        # Validate wind direction
+        if 0 <= direction <= 360:
+            result.direction = float(direction)
+        else:
+            _LOGGER.warning("Invalid wind direction: %s°", direction)
+            return
 
-                        _LOGGER.debug(
-                            "Parsed MPS wind: %s° at %s m/s (%s km/h)",
-                            direction,
-                            speed_ms,
-                            result["speed"]
-                        )
+        # Validate wind speed
+        if 0 <= speed <= unit.max_speed:
+            result.speed = round(speed * unit.to_kmh, 6)
+        else:
+            _LOGGER.warning("Invalid wind speed: %s %s", speed, unit.label)
+            return
 
-                # Parse variable wind direction (format: 180V240 or 10V90)
-                elif 'V' in part and 5 <= len(part) <= 7:
-                    match = re.match(r'(\d{2,3})V(\d{2,3})', part)
-                    if match:
-                        start_dir = int(match.group(1))
-                        end_dir = int(match.group(2))
-
-                        # Validate directions
-                        if 0 <= start_dir <= 360 and 0 <= end_dir <= 360:
-                            result["variable"] = f"{start_dir:03d}°-{end_dir:03d}°"
-                            _LOGGER.debug("Parsed variable wind direction: %s", result["variable"])
-                        else:
-                            _LOGGER.warning("Invalid variable wind directions: %s-%s", start_dir, end_dir)
-
-        except (ValueError, TypeError) as err:
-            _LOGGER.error("Error parsing wind data: %s", err)
-        except Exception as err:
-            _LOGGER.error("Unexpected error parsing wind data: %s", err)
+        if gust_code:
+            gust = int(gust_code)
+            if 0 <= gust <= unit.max_gust:
+                result.gust = round(gust * unit.to_kmh, 6)
+            else:
+                _LOGGER.warning("Invalid wind gust: %s %s", gust, unit.label)
 
-        return result
+        _LOGGER.debug(
+            "Parsed %s wind: %s° at %s %s (%s km/h)",
+            unit.code,
+            direction,
+            speed,
+            unit.label,
+            result.speed
+        )
 
     def _parse_temp_dew(self, raw_parts: List[str]) -> tuple[Optional[float], Optional[float]]:
         """Parse temperature and dew point."""
-        try:
-            for part in raw_parts:
-                # Temperature/dew point format: 04/02, M05/M10, 15/M02
-                if '/' in part:
-                    parts = part.split('/')
-                    # Must have exactly 2 parts for temp/dew
-                    if len(parts) != 2:
-                        continue
-
-                    temp_str, dew_str = parts
-
-                    # Check if this looks like temp/dew (starts with digit or M for minus)
-                    if not (temp_str and (temp_str[0].isdigit() or temp_str[0] == 'M')):
-                        continue
-                    if not (dew_str and (dew_str[0].isdigit() or dew_str[0] == 'M')):
-                        continue
-
-                    # Skip visibility parts like 1200/0800 (4-digit numbers)
-                    if len(temp_str) > 3 or len(dew_str) > 3:
-                        continue
-
-                    try:
-                        temp_val = float(temp_str.replace('M', '-'))
-                        dew_val = float(dew_str.replace('M', '-'))
-                    except ValueError:
-                        # Token merely looked like temp/dew: fractional
-                        # visibility "1/2SM" splits to "1"/"2SM". Keep
-                        # scanning for the real group.
-                        continue
-
-                    # Validate value ranges
-                    if not -100 <= temp_val <= 60:
-                        _LOGGER.warning("Temperature %s°C outside valid range", temp_val)
-                        return None, None
-                    if not -100 <= dew_val <= 60:
-                        _LOGGER.warning("Dew point %s°C outside valid range", dew_val)
-                        return None, None
-
-                    return temp_val, dew_val
-            return None, None
-        except Exception as err:
-            _LOGGER.error("Error parsing temperature/dew point: %s", err)
-            return None, None
+        for part in raw_parts:
+            # Temperature/dew point format: 04/02, M05/M10, 15/M02;
+            # 3 (1/2) to 7 (M12/M15) characters, reject others outright
+            if not 3 <= len(part) <= 7:
+                continue
+            slash = part.find('/')
+            # Must have exactly one '/' for temp/dew
+            if slash < 0 or part.find('/', slash + 1) >= 0:
+                continue
+
+            temp_val = _parse_metar_temp(part[:slash])
+            dew_val = _parse_metar_temp(part[slash + 1:])
+            if temp_val is None or dew_val is None:
+                # Token merely looked like temp/dew: visibility 1200/0800,
+                # or fractional visibility "1/2SM" split to "1"/"2SM".
+                # Keep scanning for the real group.
+                continue
+
+            # Validate value ranges
+            if not -100 <= temp_val <= 60:
+                _LOGGER.warning("Temperature %s°C outside valid range", temp_val)
+                return None, None
+            if not -100 <= dew_val <= 60:
+                _LOGGER.warning("Dew point %s°C outside valid range", dew_val)
+                return None, None
+
+            return temp_val, dew_val
+        return None, None
 
     def _parse_pressure(self, raw_parts: List[str]) -> Optional[float]:
         """Parse pressure information.
@@ -818,23 +932,27 @@ class MetarParser:
         - A3012 = 30.12 inHg (converted to hPa)
         """
         for part in raw_parts:
+            # Only Q/A groups carry pressure; skip everything else cheaply
+            first = part[0]
+            if first != 'Q' and first != 'A':
+                continue
+
+            # Both formats are plain digits after the letter; anything else
+            # (Q////, A30.1) is skipped without an exception round-trip
+            digits = part[1:]
+            if not digits.isdecimal():
+                continue
+
             # European format: Q followed by pressure in hPa
-            if part.startswith('Q') and len(part) >= 4:
-                try:
-                    return float(part[1:])
-                except ValueError:
-                    continue
+            if first == 'Q' and len(part) >= 4:
+                return float(int(digits))
 
-            # American format: A followed by pressure in inHg (e.g., A3012 = 30.12 inHg)
-            if part.startswith('A') and len(part) == 5:
-                try:
-                    inhg = float(part[1:]) / 100  # A3012 -> 30.12
-                    # Convert inHg to hPa
-                    hpa = round(inhg * INHG_TO_HPA, 6)
-                    _LOGGER.debug("Parsed A pressure: %s inHg = %s hPa", inhg, hpa)
-                    return hpa
-                except ValueError:
-                    continue
+            # American format: A followed by pressure in hundredths of inHg
+            # (e.g., A3012 = 30.12 inHg), converted to hPa in one multiply
+            if first == 'A' and len(part) == 5:
+                hpa = round(int(digits) * _INHG_HUNDREDTHS_TO_HPA, 6)
+                _LOGGER.debug("Parsed A pressure: %s = %s hPa", part, hpa)
+                return hpa
 
         return None
 
@@ -844,3 +962,14 @@ class MetarParser:
         Delegates to shared utility function for consistency with AWC client.
         """
         return calculate_humidity(temp, dew)
+
+
+@lru_cache(maxsize=PARSED_METAR_CACHE_SIZE)
+def parse_metar(raw_metar: str) -> Dict[str, Any]:
+    """Parsed data for a raw METAR, memoized by the raw string.
+
+    Each poll re-fetches the station's latest report, which only changes when
+    the station issues a new one; repeat fetches skip the parse. The returned
+    dict is shared between callers - copy it before modifying.
+    """
+    return MetarParser(raw_metar).get_parsed_data()
@@ -507,8 +507,9 @@ class MetarSensor(CoordinatorEntity, SensorEntity):
 
             # Special handling for numeric values
             if isinstance(value, (float, int)):
-                if self.entity_description.key in VALUE_RANGES:
-                    min_val, max_val = VALUE_RANGES[self.entity_description.key]
+                value_range = VALUE_RANGES.get(self.entity_description.key)
+                if value_range is not None:
+                    min_val, max_val = value_range
                     if not min_val <= float(value) <= max_val:
                         _LOGGER.warning(
                             "Value %s for %s is outside valid range (%s-%s)",
@@ -519,8 +520,9 @@ class MetarSensor(CoordinatorEntity, SensorEntity):
                         )
                         return None
 
-                if self.entity_description.key in NUMERIC_PRECISION:
-                    return round(float(value), NUMERIC_PRECISION[self.entity_description.key])
+                precision = NUMERIC_PRECISION.get(self.entity_description.key)
+                if precision is not None:
+                    return round(float(value), precision)
 
             return value
 
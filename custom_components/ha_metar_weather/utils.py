@@ -16,7 +16,6 @@ from homeassistant.const import UnitOfLength, UnitOfPressure, UnitOfSpeed
 from .const import (
     RUNWAY_SURFACE_CODES,
     RUNWAY_COVERAGE_CODES,
-    ICAO_REGEX,
     NATIVE_METAR_UNITS,
 )
 
@@ -32,6 +31,15 @@ _WIND_GROUP_RE = re.compile(
 _VIS_METERS_RE = re.compile(r"\d{4}(?:NDV|[NSEW]{1,2})?$")
 # Visibility in statute miles (North America): 10SM, P6SM, M1/4SM, 1/2SM.
 _VIS_SM_RE = re.compile(r"[PM]?\d+(?:/\d+)?SM$")
+# Pressure: Q1013 (hPa) or A2992 (inHg).
+_PRESSURE_Q_RE = re.compile(r"Q\d{4}")
+_PRESSURE_A_RE = re.compile(r"A\d{4}")
+# Runway state: R24L/123456, R24L/CLRD62, R24/SNOCLO, R24/SAND55, R24/1234//.
+_RUNWAY_STATE_RE = re.compile(
+    r"R(\d{2}[LCR]?)/(SNOCLO|CLRD[/\d]{2}|[A-Z]{4}[/\d]{2}|\d{6}|\d{4}//)"
+)
+# Start of the trend/remarks sections.
+_TREND_OR_RMK_RE = re.compile(r"\b(?:RMK|TEMPO|BECMG)\b")
 
 
 def detect_native_units(raw_metar: Optional[str]) -> Dict[str, str]:
@@ -49,7 +57,7 @@ def detect_native_units(raw_metar: Optional[str]) -> Dict[str, str]:
         return units
 
     # Trend/remark sections may repeat groups in other formats; use the body.
-    body = re.split(r"\b(?:RMK|TEMPO|BECMG)\b", raw_metar)[0]
+    body = _TREND_OR_RMK_RE.split(raw_metar, 1)[0]
     tokens = body.split()
 
     pressure_unit = None
@@ -68,10 +76,10 @@ def detect_native_units(raw_metar: Optional[str]) -> Dict[str, str]:
             units["wind_speed"],
         )
     for token in tokens:
-        if re.fullmatch(r"Q\d{4}", token):
+        if _PRESSURE_Q_RE.fullmatch(token):
             pressure_unit = UnitOfPressure.HPA
             break
-        if re.fullmatch(r"A\d{4}", token):
+        if _PRESSURE_A_RE.fullmatch(token):
             pressure_unit = UnitOfPressure.INHG
             break
     if pressure_unit:
@@ -109,11 +117,13 @@ def validate_icao_format(icao: str) -> bool:
         icao: ICAO airport code (e.g., "KJFK", "EGLL")
 
     Returns:
-        True if format is valid (4 alphanumeric characters)
+        True if format is valid (4 ASCII alphanumeric characters)
     """
     if not icao:
         return False
-    return bool(re.match(ICAO_REGEX, icao.upper()))
+    # Exactly 4 ASCII letters or digits
+    icao = icao.upper()
+    return len(icao) == 4 and icao.isascii() and icao.isalnum()
 
 
 def calculate_humidity(temp: Optional[float], dew: Optional[float]) -> Optional[float]:
@@ -169,10 +179,7 @@ def parse_runway_states_from_raw(raw_metar: str) -> Dict[str, Dict[str, Any]]:
     runway_states: Dict[str, Dict[str, Any]] = {}
 
     try:
-        matches = re.finditer(
-            r'R(\d{2}[LCR]?)/(SNOCLO|CLRD[/\d]{2}|[A-Z]{4}[/\d]{2}|\d{6}|\d{4}//)',
-            raw_metar
-        )
+        matches = _RUNWAY_STATE_RE.finditer(raw_metar)
         for match in matches:
             runway = match.group(1)
             conditions = match.group(2)
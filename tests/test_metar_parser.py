@@ -5,9 +5,13 @@ the textual (weather / clouds / trend / runway) and numeric output so both the
 AWC and AVWX data paths can rely on a single parser (see issue #3).
 """
 
+import logging
+
 import pytest
 
-from custom_components.ha_metar_weather.metar_parser import MetarParser
+from custom_components.ha_metar_weather.metar_parser import MetarParser, parse_metar
+
+PARSER_LOGGER = "custom_components.ha_metar_weather.metar_parser"
 
 
 def parse(raw: str) -> dict:
@@ -112,6 +116,19 @@ def test_numeric_temperature_dew():
     assert data["dew_point"] == pytest.approx(18.0)
 
 
+def test_numeric_temperature_dew_below_zero():
+    data = parse("UUEE 121630Z 24008MPS 9999 OVC010 M05/M10 Q1009")
+    assert data["temperature"] == pytest.approx(-5.0)
+    assert data["dew_point"] == pytest.approx(-10.0)
+
+
+def test_temp_dew_rejects_malformed_halves():
+    """Sign-only or non-digit halves are not a temp/dew group."""
+    data = parse("UUEE 121630Z 24008MPS 9999 OVC010 M/1.5 12/M03 Q1009")
+    assert data["temperature"] == pytest.approx(12.0)
+    assert data["dew_point"] == pytest.approx(-3.0)
+
+
 def test_numeric_pressure_inhg_to_hpa():
     data = parse("KJFK 121651Z 18010KT 10SM FEW020 22/18 A2992")
     # A2992 = 29.92 inHg -> hPa
@@ -188,3 +205,104 @@ def test_wind_mps_exact_kmh():
     """8 m/s = 28.8 km/h exactly; must not be quantized through knots."""
     data = parse("UUEE 121630Z 24008MPS 9999 BKN040 18/12 Q1009 NOSIG")
     assert data["wind_speed"] == pytest.approx(28.8)
+
+
+def test_empty_report_has_full_key_set():
+    """The empty-input short cut returns the same keys as a real parse."""
+    data = parse("")
+    full = parse("UUEE 121630Z 24008MPS 9999 BKN040 18/12 Q1009 NOSIG")
+    assert data.keys() == full.keys()
+    assert data["weather"] == "clear"
+    assert data["cloud_layers"] == []
+    # Each result gets its own containers
+    assert parse("")["cloud_layers"] is not data["cloud_layers"]
+
+
+def test_parsed_structures_have_no_instance_dict():
+    """CloudLayer/RunwayState are slotted; output is built without __dict__."""
+    parser = MetarParser(
+        "EFHK 121650Z 18005MPS 9999 R04L/CLRD62 BKN012CB 02/M01 Q0995"
+    )
+    layer = parser.parse_cloud_layers()[0]
+    state = parser.parse_runway_states()["04L"]
+    assert not hasattr(layer, "__dict__")
+    assert not hasattr(state, "__dict__")
+    data = parser.get_parsed_data()
+    assert data["cloud_layers"][0] == {
+        "coverage": "broken", "height": 1200, "type": "cumulonimbus"
+    }
+    assert data["runway_states"]["04L"]["friction"] == pytest.approx(0.62)
+
+
+def test_wind_variation_group_after_wind():
+    data = parse("EFHK 121650Z 18005MPS 150V210 9999 BKN012 02/M01 Q0995")
+    assert data["wind_direction"] == 180.0
+    assert data["wind_variable_direction"] == "150°-210°"
+    assert data["visibility"] == pytest.approx(10.0)
+
+
+def test_cloud_debug_logging_when_enabled(caplog):
+    """Per-group cloud debug lines are emitted only with DEBUG enabled."""
+    raw = "KJFK 121651Z 18010KT 10SM FEW020 22/18 A2992"
+    with caplog.at_level(logging.INFO, logger=PARSER_LOGGER):
+        parse(raw)
+    assert "Parsed cloud layer" not in caplog.text
+    with caplog.at_level(logging.DEBUG, logger=PARSER_LOGGER):
+        parse(raw)
+    assert "Parsed cloud layer" in caplog.text
+
+
+def test_wind_variation_requires_whole_token():
+    data = parse("EFHK 121650Z 18005MPS 150V21X 9999 BKN012 02/M01 Q0995")
+    assert data["wind_direction"] == 180.0
+    assert data["wind_variable_direction"] is None
+
+
+def test_parse_metar_memoizes_by_raw_string():
+    raw = "UUEE 121630Z 24008MPS 9999 BKN040 18/12 Q1009 NOSIG"
+    first = parse_metar(raw)
+    assert parse_metar(raw) is first
+    assert first == parse(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "KJFK 121651Z 18010KT 10SM FEW020 BKN040 22/18 A2992",
+        "EFHK 121650Z 18005MPS 9999 BKN012CB 02/M01 Q0995",
+        "UUEE 121630Z 00000KT CAVOK 18/12 Q1009 NOSIG",
+        "KBOS 121654Z 05012KT 1/4SM FG VV002 03/02 A2980",
+        "KSFO 121656Z 28012KT P6SM 18/09 A3001",
+    ],
+)
+def test_cloud_summary_matches_helper_methods(raw):
+    """get_parsed_data reads the first layer inline; it must agree with
+    the public parse_cloud_coverage/_height/_type helpers."""
+    parser = MetarParser(raw)
+    data = parser.get_parsed_data()
+    assert data["cloud_coverage_state"] == parser.parse_cloud_coverage()
+    assert data["cloud_coverage_height"] == parser.parse_cloud_height()
+    assert data["cloud_coverage_type"] == parser.parse_cloud_type()
+
+
+def test_wind_found_when_icao_ends_in_kt():
+    """Regression: PAKT (Ketchikan) ends in KT but is not the wind group."""
+    data = parse("PAKT 151253Z 13008KT 10SM FEW020 22/18 A2992")
+    assert data["wind_direction"] == 130.0
+    assert data["wind_speed"] == pytest.approx(14.816)
+    assert data["visibility"] == pytest.approx(16.09, abs=0.01)
+
+
+def test_wind_found_when_icao_ends_in_kt_after_report_type():
+    """The METAR/SPECI prefix is skipped before the station code."""
+    data = parse("METAR PAKT 151253Z 13008KT 10SM FEW020 22/18 A2992")
+    assert data["wind_direction"] == 130.0
+    assert data["wind_speed"] == pytest.approx(14.816)
+
+
+def test_malformed_wind_still_anchors_visibility():
+    """A KT token the wind parser rejects still marks where visibility starts."""
+    data = parse("EFHK 121651Z AUTO 1308KT 0800 VCFG BKN002 M01/M02 Q1012")
+    assert data["wind_speed"] is None
+    assert data["wind_direction"] is None
+    assert data["visibility"] == pytest.approx(0.8)
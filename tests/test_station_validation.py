@@ -0,0 +1,185 @@
+"""Tests for station validation in the config and options flows.
+
+A station AWC has a raw METAR for is accepted without asking AVWX; on an
+AWC miss AVWX is asked directly, and its failures map to the flow errors.
+
+The flows also share one probe per ICAO code: a second request for a
+station that is already being checked waits for the running probe instead
+of starting its own. The waiter must see the probe's outcome (success or
+error), and the in-flight entry must be gone once it settles.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from avwx.exceptions import BadStation
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ha_metar_weather import config_flow
+from custom_components.ha_metar_weather.config_flow import (
+    CannotConnect,
+    InvalidStation,
+    _async_validate_station,
+    _cached_validate_station,
+)
+from custom_components.ha_metar_weather.const import (
+    DATA_STATION_INFLIGHT,
+    DATA_STATION_PROBES,
+    VALIDATION_CACHE_TTL,
+)
+
+AWC_URL = "https://aviationweather.gov/api/data/metar"
+RAW_OB = "KJFK 121651Z 24008KT 10SM FEW250 18/04 A3021"
+
+
+def _avwx_metar(update_error: Exception | None = None) -> MagicMock:
+    """avwx.Metar stand-in whose update() succeeds or raises ``update_error``."""
+    metar = MagicMock()
+    metar.raw = RAW_OB
+    metar.data = SimpleNamespace(time=None)
+    metar.station = SimpleNamespace(name="John F Kennedy Intl")
+    if update_error is not None:
+        metar.update.side_effect = update_error
+    return metar
+
+
+async def test_awc_report_skips_avwx(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """An AWC row with a raw METAR is enough; AVWX is not asked."""
+    aioclient_mock.get(AWC_URL, json=[{"icaoId": "KJFK", "rawOb": RAW_OB}])
+
+    with patch("avwx.Metar") as avwx_metar:
+        assert await _async_validate_station(hass, "KJFK") is True
+
+    avwx_metar.assert_not_called()
+    assert aioclient_mock.call_count == 1
+
+
+async def test_awc_row_without_raw_ob_falls_back_to_avwx(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A row AWC cannot give a raw METAR for is checked against AVWX."""
+    aioclient_mock.get(AWC_URL, json=[{"icaoId": "KJFK", "temp": 18}])
+    metar = _avwx_metar()
+
+    with patch("avwx.Metar", return_value=metar):
+        assert await _async_validate_station(hass, "KJFK") is True
+
+    metar.update.assert_called_once()
+    assert aioclient_mock.call_count == 1
+
+
+async def test_avwx_bad_station_is_invalid_station(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """AVWX rejecting the code surfaces as InvalidStation."""
+    aioclient_mock.get(AWC_URL, status=204)
+
+    with patch("avwx.Metar", return_value=_avwx_metar(BadStation("ZZZZ"))):
+        with pytest.raises(InvalidStation):
+            await _async_validate_station(hass, "ZZZZ")
+
+
+async def test_avwx_network_error_is_cannot_connect(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A network failure inside avwx surfaces as CannotConnect."""
+    aioclient_mock.get(AWC_URL, status=204)
+
+    with patch("avwx.Metar", return_value=_avwx_metar(ConnectionError("down"))):
+        with pytest.raises(CannotConnect):
+            await _async_validate_station(hass, "KJFK")
+
+
+def _gated_probe(release: asyncio.Event, error: Exception | None = None) -> AsyncMock:
+    """Probe mock that blocks until ``release`` is set, then succeeds or raises."""
+
+    async def _probe(hass: HomeAssistant, icao: str) -> bool:
+        await release.wait()
+        if error is not None:
+            raise error
+        return True
+
+    return AsyncMock(side_effect=_probe)
+
+
+async def test_concurrent_calls_share_one_probe(hass: HomeAssistant) -> None:
+    """Two flows validating the same station trigger a single probe."""
+    release = asyncio.Event()
+    probe = _gated_probe(release)
+
+    with patch.object(config_flow, "_async_validate_station", probe):
+        first = hass.async_create_task(_cached_validate_station(hass, "KJFK"))
+        second = hass.async_create_task(_cached_validate_station(hass, "KJFK"))
+        await asyncio.sleep(0)
+        release.set()
+        assert await first is True
+        assert await second is True
+
+    assert probe.await_count == 1
+    assert "KJFK" not in hass.data[DATA_STATION_INFLIGHT]
+
+
+async def test_probe_error_reaches_waiter(hass: HomeAssistant) -> None:
+    """A failing probe raises the same error in the piggybacking caller."""
+    release = asyncio.Event()
+    probe = _gated_probe(release, InvalidStation())
+
+    with patch.object(config_flow, "_async_validate_station", probe):
+        first = hass.async_create_task(_cached_validate_station(hass, "ZZZZ"))
+        second = hass.async_create_task(_cached_validate_station(hass, "ZZZZ"))
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(InvalidStation):
+            await first
+        with pytest.raises(InvalidStation):
+            await second
+
+    assert probe.await_count == 1
+    assert "ZZZZ" not in hass.data[DATA_STATION_INFLIGHT]
+
+
+async def test_cancelled_owner_gives_waiter_cannot_connect(
+    hass: HomeAssistant,
+) -> None:
+    """Cancelling the flow that owns the probe does not cancel its waiters."""
+    release = asyncio.Event()
+    probe = _gated_probe(release)
+
+    with patch.object(config_flow, "_async_validate_station", probe):
+        owner = hass.async_create_task(_cached_validate_station(hass, "EGLL"))
+        await asyncio.sleep(0)
+        waiter = hass.async_create_task(_cached_validate_station(hass, "EGLL"))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        with pytest.raises(CannotConnect):
+            await waiter
+
+    assert probe.await_count == 1
+    assert "EGLL" not in hass.data[DATA_STATION_INFLIGHT]
+
+
+async def test_expired_probes_are_swept(hass: HomeAssistant) -> None:
+    """Every expired success is removed, not just the station looked up."""
+    probes = hass.data.setdefault(DATA_STATION_PROBES, {})
+    expired = time.monotonic() - VALIDATION_CACHE_TTL - 1
+    probes["KJFK"] = expired
+    probes["EGLL"] = expired
+    probes["EDDF"] = time.monotonic()
+    probe = AsyncMock(side_effect=CannotConnect)
+
+    with patch.object(config_flow, "_async_validate_station", probe):
+        with pytest.raises(CannotConnect):
+            await _cached_validate_station(hass, "KJFK")
+
+    assert probe.await_count == 1
+    assert set(probes) == {"EDDF"}